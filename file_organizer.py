@@ -3,6 +3,7 @@
 # Ensure tkinter is installed: sudo dnf install python3-tkinter
 import os
 import shutil
+import stat
 import tkinter as tk
 from tkinter import filedialog, messagebox, Toplevel, Text, ttk, scrolledtext
 from datetime import datetime
@@ -10,24 +11,378 @@ import json
 import re
 import time
 import platform
-from pathlib import Path
 import urllib.parse
 import subprocess
+import sys
+import importlib
 import threading
+import traceback
+import hashlib
+import errno
+import socket
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 
 try:
-    from PIL import Image, ImageTk
-    from PIL.ExifTags import TAGS
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+try:
+    import exifread
+except ImportError:  # Optional - reads GPS tags without Pillow decoding the image headers
+    exifread = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional - faster parsing of geocoding responses
+    _json_loads = json.loads
+
+# Home folder, resolved once; the config and caches live directly in it
+HOME_DIR = os.path.expanduser("~")
+CONFIG_FILE = os.path.join(HOME_DIR, ".file_organizer_config.json")
+METADATA_CACHE_FILE = os.path.join(HOME_DIR, ".file_organizer_metadata_cache.json")
+GEOCODE_CACHE_FILE = os.path.join(HOME_DIR, ".file_organizer_geocode_cache.json")
+
+# Linux ioctl to clone a file's extents (copy-on-write reflink on btrfs/XFS)
+FICLONE = 0x40049409
+
+# Windows and macOS filesystems ignore case in file names by default
+CASE_INSENSITIVE_NAMES = platform.system() in ("Windows", "Darwin")
+
+# Windows: MoveFileExW can move across volumes itself, copying in the kernel
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+    _MoveFileExW = ctypes.WinDLL("kernel32", use_last_error=True).MoveFileExW
+    _MoveFileExW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD)
+    _MoveFileExW.restype = wintypes.BOOL
+else:
+    _MoveFileExW = None
+MOVEFILE_COPY_ALLOWED = 0x2
+MOVEFILE_WRITE_THROUGH = 0x8
+ERROR_FILE_EXISTS = 80
+ERROR_ALREADY_EXISTS = 183
+
+# Buffer size for the plain read/write copy fallback
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Image formats that may carry an EXIF capture date
+EXIF_DATE_EXTENSIONS = ('.jpg', '.jpeg', '.tiff', '.png')
+
+# EXIF tag ids checked for a date, in order of preference:
+# DateTimeOriginal, DateTime, DateTimeDigitized
+EXIF_DATE_TAGS = (36867, 306, 36868)
+# EXIF tag id of the GPS IFD
+EXIF_GPSINFO_TAG = 34853
+
+# Most entries kept per kind in the on-disk EXIF date/GPS cache
+METADATA_CACHE_LIMIT = 50000
+
+# How long a reverse geocoding result is reused (30 days)
+GEOCODE_CACHE_TTL = 30 * 24 * 3600
+
+# Nominatim allows at most one request per second; lookups run in
+# GEOCODE_WORKERS threads to overlap network latency within that limit
+GEOCODE_MIN_INTERVAL = 1.0
+GEOCODE_WORKERS = 2
+
+# Geocoding requests retried after a connection error or one of these statuses,
+# each retry waiting for its rate limit slot (and any Retry-After) like the first
+GEOCODE_RETRIES = 3
+GEOCODE_RETRY_STATUSES = (429, 502, 503)
+
+# Nominatim zoom level per location granularity
+GEOCODE_ZOOM_LEVELS = {"country": 3, "city": 10, "exact": 18}
+
+# Address fields tried, in order, for a city/region folder name
+GEOCODE_CITY_FIELDS = ("city", "town", "village", "county", "state", "country")
+
+# Uncached EXIF candidates needed before dates are read in worker processes
+EXIF_PROCESS_POOL_MIN = 1000
+
+# Queued log messages are written to the log widget every LOG_DRAIN_INTERVAL_MS,
+# at most LOG_DRAIN_BATCH lines per pass
+LOG_DRAIN_INTERVAL_MS = 100
+LOG_DRAIN_BATCH = 500
+
+# Processing dialog updates from workers are drawn at most this often
+DIALOG_UPDATE_INTERVAL_MS = 50
+
+# Lines kept in the log widget; older lines are dropped from the top
+LOG_MAX_LINES = 5000
+
+# Preview rows inserted before the preview window is shown, and per batch after it
+PREVIEW_FIRST_ROWS = 200
+PREVIEW_INSERT_BATCH = 500
+
+# Seconds to wait for an SMB server to accept a connection before a network
+# folder is reported as unreachable (instead of hanging on the OS timeout)
+SMB_PROBE_TIMEOUT = 1.5
+SMB_PORTS = (445, 139)
+
+# Seconds between running totals on the status bar while a folder is counted
+STATUS_UPDATE_INTERVAL = 0.25
+
+# Subfolders of the selected folder counted at once (listings on network shares
+# mostly wait on the server, so they overlap well)
+COUNT_WORKERS = 8
+
+# Seconds a folder count's file listing may be reused by a preview before it
+# is walked again
+SCAN_CACHE_TTL = 30
+
+# Pillow is imported lazily by _get_pil() so it doesn't slow down startup
+HAS_PIL = None  # None until the first import attempt
+Image = ImageTk = None
+
+def _get_pil():
+    """Import Pillow on first use and return True if it is available"""
+    global HAS_PIL, Image, ImageTk
+    if HAS_PIL is None:
+        try:
+            from PIL import Image, ImageTk
+            HAS_PIL = True
+        except ImportError:
+            HAS_PIL = False
+    return HAS_PIL
+
+def _name_key(name):
+    """Form of a file name that clashes with existing names on this platform's filesystems"""
+    return name.casefold() if CASE_INSENSITIVE_NAMES else name
+
+def _parse_exif_datetime(date_str):
+    """Fast parse of fixed-layout EXIF dates like "2020:01:30 14:31:26" or "2020-01-30 14:31:26"
+    
+    Returns None if the string doesn't have that exact layout, so callers can fall
+    back to strptime. Raises ValueError for invalid field values.
+    """
+    if (len(date_str) == 19 and date_str[4] == date_str[7] and date_str[4] in ":-"
+            and date_str[10] == " " and date_str[13] == ":" and date_str[16] == ":"):
+        return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                        int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]))
+    return None
+
+def _read_exif_date(file_path):
+    """Read the capture date from an image's EXIF block
+    
+    Module level so it can also run in EXIF worker processes.
+    """
+    _get_pil()
+    # Image.open only reads the headers; parse the EXIF block once and
+    # look the date tags up by id instead of naming every tag
+    with Image.open(file_path) as image:
+        exif_data = image._getexif() if hasattr(image, '_getexif') else None
+    if not exif_data:
+        return None
+    
+    # Try different date fields
+    for tag in EXIF_DATE_TAGS:
+        if exif_data.get(tag):
+            # Format usually like "2020:01:30 14:31:26"
+            date_str = str(exif_data[tag])
+            try:
+                parsed = _parse_exif_datetime(date_str)
+                if parsed:
+                    return parsed
+            except ValueError:
+                continue
+            try:
+                return datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
+            except ValueError:
+                try:
+                    # Try another common format
+                    return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+                except ValueError:
+                    continue
+    return None
+
+def _country_from_geocode(data):
+    """Country name from a Nominatim reverse geocoding response"""
+    return data.get("address", {}).get("country") or "Unknown Country"
+
+def _city_from_geocode(data):
+    """City/region name (with country) from a Nominatim reverse geocoding response, or "" """
+    address = data.get("address", {})
+    # Try different fields for city/region name in priority order
+    for field in GEOCODE_CITY_FIELDS:
+        if field in address:
+            if field != "country" and "country" in address:
+                return f"{address[field]}, {address['country']}"
+            return address[field]
+    
+    # Fallback to display_name which contains the complete address
+    if "display_name" in data:
+        # Take just the first part of the display name to keep it shorter
+        parts = data["display_name"].split(",")
+        if len(parts) > 2:
+            return f"{parts[0].strip()}, {parts[-1].strip()}"
+        return data["display_name"]
+    return ""
+
+# Location name reader per granularity; granularities without one use coordinates
+GEOCODE_NAME_READERS = {"country": _country_from_geocode, "city": _city_from_geocode}
+
+def _file_extension(filename):
+    """Extension of a bare file name, dot included - same result as os.path.splitext(filename)[1]
+    
+    Leading dots don't start an extension, so ".bashrc" has none.
+    """
+    name = filename.lstrip(".")
+    dot = name.rfind(".")
+    return name[dot:] if dot > 0 else ""
+
+def _read_exif_date_batch(file_paths):
+    """Read EXIF dates for several files in a worker process
+    
+    Returns a list of (path, date, error message) tuples so errors can be logged by the app.
+    """
+    results = []
+    for file_path in file_paths:
+        try:
+            results.append((file_path, _read_exif_date(file_path), None))
+        except Exception as e:
+            results.append((file_path, None, str(e)))
+    return results
+
+def _write_json_atomic(path, data):
+    """Write data as JSON to a temporary file first, then atomically swap it in"""
+    tmp_file = path + ".tmp"
+    with open(tmp_file, 'w') as f:
+        # Compact separators - the metadata cache can hold tens of thousands of entries
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp_file, path)
+
+# Paths recently found to exist, as {path: monotonic time of the check}. Only
+# hits are kept, so a folder that appears later is seen straight away
+_path_exists_cache = {}
+PATH_EXISTS_TTL = 5
+PATH_EXISTS_CACHE_SIZE = 64
+
+def _path_exists_cached(path):
+    """os.path.exists, remembering hits for PATH_EXISTS_TTL seconds
+    
+    Avoids repeated (possibly network) lookups while the same path is checked.
+    """
+    now = time.monotonic()
+    checked_at = _path_exists_cache.get(path)
+    if checked_at is not None and now - checked_at < PATH_EXISTS_TTL:
+        return True
+    if not os.path.exists(path):
+        _path_exists_cache.pop(path, None)
+        return False
+    if len(_path_exists_cache) >= PATH_EXISTS_CACHE_SIZE:
+        _path_exists_cache.clear()
+    _path_exists_cache[path] = now
+    return True
+
+# Network Share Help tab texts
+NETWORK_HELP_GENERAL = """Network Share Access - General Information
+
+To access shared network folders (SMB/CIFS shares):
+
+1. Direct Entry: You can type a network path directly in the format:
+   • //server/share or \\\\server\\share
+
+2. Path with credentials (if needed):
+   • //username:password@server/share
+
+3. Common network path issues:
+   • Make sure the server is online and accessible from your network
+   • Verify you have permission to access the shared folder
+   • Some networks require you to be on the same LAN or VPN
+   • Firewalls may block SMB/CIFS traffic (ports 139 and 445)
+
+This application will attempt to access the path you provide. If connection 
+fails, you may need to first mount/map the drive using your operating system's 
+tools as described in the platform-specific tabs.
+"""
+
+NETWORK_HELP_WINDOWS = """Windows - Accessing Network Shares
+
+Method 1: Map a Network Drive
+1. Open File Explorer
+2. Right-click on "This PC" and select "Map network drive..."
+3. Choose a drive letter and enter the network path (\\\\server\\share)
+4. Check "Connect using different credentials" if needed
+5. Click "Finish" and enter credentials if prompted
+
+Method 2: Direct Access
+1. In File Explorer address bar, type \\\\server\\share
+2. Press Enter
+3. Enter credentials if prompted
+
+Troubleshooting:
+• Make sure Network Discovery is enabled
+• Check Windows Defender Firewall settings
+• Verify the remote computer is using SMB v1, v2, or v3 compatible with your Windows version
+• Try accessing with full credentials: \\\\username:password@server\\share
+"""
+
+NETWORK_HELP_LINUX = """Linux - Accessing Network Shares
+
+Method 1: Mount using terminal
+1. Create a mount point:
+   sudo mkdir -p /mnt/networkshare
+
+2. Mount the share:
+   sudo mount -t cifs //server/share /mnt/networkshare -o username=user,password=pass
+
+3. For permanent mounting, add to /etc/fstab:
+   //server/share /mnt/networkshare cifs username=user,password=pass,uid=1000,gid=1000 0 0
+
+Method 2: Using file manager
+Most Linux file managers support entering network paths directly:
+1. Open file manager (Nautilus, Dolphin, etc.)
+2. Press Ctrl+L to edit location
+3. Enter: smb://server/share
+4. Enter credentials when prompted
+
+Prerequisites:
+• cifs-utils package must be installed:
+   Ubuntu/Debian: sudo apt install cifs-utils
+   Fedora/RHEL: sudo dnf install cifs-utils
+"""
+
+NETWORK_HELP_MAC = """macOS - Accessing Network Shares
+
+Method 1: Using Finder
+1. In Finder, click "Go" menu and select "Connect to Server..." (or press ⌘K)
+2. Enter the server address: smb://server/share
+3. Click "Connect"
+4. Enter credentials when prompted
+
+Method 2: Using Terminal
+1. Create a mount point:
+   mkdir -p ~/NetworkShares/myshare
+
+2. Mount the share:
+   mount -t smbfs //username:password@server/share ~/NetworkShares/myshare
+
+Method 3: Auto-mount on login
+1. Open System Preferences
+2. Go to "Users & Groups"
+3. Select your account and click "Login Items"
+4. Add the network share to login items
+
+Troubleshooting:
+• Make sure SMB is enabled in Sharing settings
+• Try different SMB versions: smb://server/share?SMB_VER=1.0
+• Check your macOS Firewall settings
+"""
 
 class ToolTip:
     """Create a tooltip for a given widget with improved show/hide behavior"""
+    # One tooltip window shared by every tooltip, created on first use and
+    # withdrawn rather than destroyed when hidden
+    _shared_window = None
+    _shared_label = None
+    
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tooltip = None
         self.id = None  # For tracking show delay
         self.widget.bind("<Enter>", self.on_enter)
         self.widget.bind("<Leave>", self.on_leave)
@@ -52,40 +407,90 @@ class ToolTip:
 
     def show_tooltip(self):
         """Display the tooltip"""
-        # Make sure any existing tooltip is destroyed first
-        self.hide_tooltip()
-        
+        self.id = None
         x, y, _, _ = self.widget.bbox("insert")
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 25
         
-        # Create top level window
-        self.tooltip = tk.Toplevel(self.widget)
+        # Reuse the shared window - just move it and change its text
+        window = self._get_shared_window()
+        ToolTip._shared_label.config(text=self.text)
+        window.wm_geometry(f"+{x}+{y}")
+        window.deiconify()
+        window.lift()
+    
+    def _get_shared_window(self):
+        """Return the shared tooltip window, creating it if needed"""
+        window = ToolTip._shared_window
+        try:
+            if window is not None and window.winfo_exists():
+                return window
+        except tk.TclError:
+            pass
+        
+        # Owned by the main window, so closing a dialog doesn't take it along
+        window = tk.Toplevel(self.widget.nametowidget("."))
+        window.withdraw()
         # Remove window decorations
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
+        window.wm_overrideredirect(True)
         
         # Add extra wm attributes for better behavior
-        self.tooltip.attributes("-topmost", True)
+        window.attributes("-topmost", True)
         
-        label = tk.Label(self.tooltip, text=self.text, background="#FFFFDD",
+        label = tk.Label(window, background="#FFFFDD",
                      wraplength=250, font=("tahoma", 9), padx=5, pady=3)
         label.pack()
         
-        # Additional bindings to ensure tooltip gets destroyed
-        self.tooltip.bind("<Leave>", self.hide_tooltip)
+        # Additional binding to ensure the tooltip gets hidden
+        window.bind("<Leave>", self.hide_tooltip)
+        ToolTip._shared_window = window
+        ToolTip._shared_label = label
+        return window
         
     def hide_tooltip(self, event=None):
-        """Destroy the tooltip window"""
-        if self.tooltip:
+        """Hide the tooltip window"""
+        if ToolTip._shared_window is not None:
             try:
-                self.tooltip.destroy()
+                ToolTip._shared_window.withdraw()
             except tk.TclError:
                 # Window might already be destroyed
                 pass
-            self.tooltip = None
 
 class FileOrganizerApp:
+    # Date patterns recognised in filenames, compiled once and tried in order
+    _DATE_PATTERNS = [re.compile(pattern) for pattern in (
+        # YYYY-MM-DD or YYYY_MM_DD
+        r'(?P<year>\d{4})[-_](?P<month>\d{2})[-_](?P<day>\d{2})',
+        # YYYYMMDD
+        r'(?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})',
+        # DD-MM-YYYY or DD_MM_YYYY
+        r'(?P<day>\d{2})[-_](?P<month>\d{2})[-_](?P<year>\d{4})',
+        # MM-DD-YYYY or MM_DD_YYYY
+        r'(?P<month>\d{2})[-_](?P<day>\d{2})[-_](?P<year>\d{4})',
+        # Common camera/phone formats like IMG_20181216_140830
+        r'IMG[_-](?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})[_-]',
+        # Generic pattern for finding dates anywhere in the filename
+        r'(?<!\d)(?P<year>20\d{2})(?P<month>0[1-9]|1[0-2])(?P<day>[0-3]\d)(?!\d)',
+    )]
+    # Every date pattern contains a four-digit year, so names without one can be skipped
+    _YEAR_PREFILTER = re.compile(r'\d{4}')
+    
+    # Characters not allowed in folder names on Windows
+    _ILLEGAL_PATH_CHARS = re.compile(r'[<>:"/\\|?*]')
+    
+    # Date folder name builders per date format option (f-strings avoid strftime's locale handling)
+    _DATE_FOLDER_FORMATS = {
+        "year": lambda d: f"{d.year:04d}",
+        "month": lambda d: f"{d.year:04d}-{d.month:02d}",
+        "day": lambda d: f"{d.year:04d}-{d.month:02d}-{d.day:02d}",
+    }
+
+    # Image types sorted by the resolution preview
+    _RESOLUTION_IMAGE_EXTENSIONS = frozenset(('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'))
+
+    # Size units after bytes, with the decimals shown for each
+    _SIZE_UNITS = (("KB", 1), ("MB", 1), ("GB", 2))
+
     def __init__(self, root):
         self.root = root
         self.root.title("File Organizer")
@@ -94,10 +499,32 @@ class FileOrganizerApp:
         self.root.resizable(True, True)
 
         # Config file path
-        self.config_file = os.path.join(os.path.expanduser("~"), ".file_organizer_config.json")
+        self.config_file = CONFIG_FILE
         
         # Load config
         self.config = self.load_config()
+        self._last_saved_config = None  # Last config written, to skip identical rewrites
+        
+        # EXIF date/GPS results keyed by path and checked against mtime and size,
+        # loaded from disk on first use (under a lock, as worker threads may be
+        # first) and saved on exit
+        self.metadata_cache_file = METADATA_CACHE_FILE
+        self._metadata_cache = None
+        self._metadata_cache_dirty = False
+        self._metadata_cache_lock = threading.Lock()
+        
+        # Reverse geocoding results keyed by rounded coordinates and granularity,
+        # loaded from disk on first use (under a lock, as worker threads may be
+        # first) and saved on exit
+        self.geocode_cache_file = GEOCODE_CACHE_FILE
+        self._geocode_cache = None
+        self._geocode_cache_dirty = False
+        self._geocode_cache_lock = threading.Lock()
+        
+        # Earliest time the next geocoding request may be sent
+        self._geocode_rate_lock = threading.Lock()
+        self._next_geocode_at = 0.0
+        self._geocode_session = None  # requests.Session, created on first lookup
         
         # File category definitions - load from config or use defaults
         default_categories = {
@@ -111,6 +538,12 @@ class FileOrganizerApp:
         }
         self.category_definitions = self.config.get("category_definitions", default_categories)
         
+        # Extension -> category lookup; the first category listing an extension wins
+        self._ext_to_category = {}
+        for category, extensions in self.category_definitions.items():
+            for ext in extensions:
+                self._ext_to_category.setdefault(ext.lower(), category)
+        
         # Add location grouping options
         self.location_granularity = tk.StringVar()
         self.location_granularity.set("city")  # Default to city level
@@ -139,10 +572,16 @@ class FileOrganizerApp:
         self.date_format.set(self.config.get("date_format", "day"))
         
         # Store last used directory
-        self.last_directory = self.config.get("last_directory", os.path.expanduser("~"))
+        self.last_directory = self.config.get("last_directory", HOME_DIR)
         
-        # Recent folders list (keep top 5)
-        self.recent_folders = self.config.get("recent_folders", [])
+        # Recent folders, most recent first (keep top 5)
+        self.recent_folders = deque(self.config.get("recent_folders", []), maxlen=5)
+        
+        # Folders created by an organize by type or category, as {path: [mode, inode]};
+        # later previews in the same mode don't walk them again. The inode tells a
+        # folder the user made later under the same name from the one created here
+        self.organized_folders = self.config.get("organized_folders", {})
+        self.preview_mode = None
 
         # Create frames for better organization
         top_frame = tk.Frame(root)
@@ -155,11 +594,9 @@ class FileOrganizerApp:
         options_frame = tk.Frame(root)
         options_frame.pack(fill="x", padx=20, pady=10)
         
-        date_options_frame = tk.Frame(root)
-        date_options_frame.pack(fill="x", padx=20, pady=5)
-        
-        date_format_frame = tk.Frame(root)
-        date_format_frame.pack(fill="x", padx=20, pady=5)
+        # Date source and date sorting level share one grid
+        date_frame = tk.Frame(root)
+        date_frame.pack(fill="x", padx=20, pady=5)
 
         buttons_frame = tk.Frame(root)
         buttons_frame.pack(fill="x", padx=20, pady=10)
@@ -198,37 +635,37 @@ class FileOrganizerApp:
             ToolTip(recent_btn, "Select from recently used folders")
 
         # Date source options frame
-        date_label = tk.Label(date_options_frame, text="Date Source:", font=("Arial", 10))
+        date_label = tk.Label(date_frame, text="Date Source:", font=("Arial", 10))
         date_label.grid(row=0, column=0, sticky="w", pady=5)
         
         # Radio buttons with tooltips
-        rb1 = tk.Radiobutton(date_options_frame, text="All Sources (Filename → EXIF → File Date)",
+        rb1 = tk.Radiobutton(date_frame, text="All Sources (Filename → EXIF → File Date)",
                       variable=self.date_source, value="all")
         rb1.grid(row=0, column=1, sticky="w")
         ToolTip(rb1, "Try to extract date first from filename, then from EXIF metadata, and finally from file creation date.")
         
-        rb2 = tk.Radiobutton(date_options_frame, text="Filename Only",
+        rb2 = tk.Radiobutton(date_frame, text="Filename Only",
                       variable=self.date_source, value="filename") 
         rb2.grid(row=1, column=1, sticky="w")
         ToolTip(rb2, "Only extract date from filename patterns like YYYY-MM-DD. Falls back to file creation date if no pattern is found.")
         
-        rb3 = tk.Radiobutton(date_options_frame, text="EXIF Only",
+        rb3 = tk.Radiobutton(date_frame, text="EXIF Only",
                       variable=self.date_source, value="exif")
         rb3.grid(row=2, column=1, sticky="w")
         ToolTip(rb3, "Only extract date from image EXIF metadata. Falls back to file creation date if no EXIF data is found.")
         
-        rb4 = tk.Radiobutton(date_options_frame, text="File Date Only",
+        rb4 = tk.Radiobutton(date_frame, text="File Date Only",
                       variable=self.date_source, value="filedate")
         rb4.grid(row=3, column=1, sticky="w")
         ToolTip(rb4, "Use only the file's creation date/time for organization.")
 
         # Add a help button
-        help_button = tk.Button(date_options_frame, text="?", width=2, command=self.show_date_help)
+        help_button = tk.Button(date_frame, text="?", width=2, command=self.show_date_help)
         help_button.grid(row=0, column=2, padx=5)
         
         # Date format options (granularity)
-        date_format_label = tk.Label(date_format_frame, text="Date Sorting Level:", font=("Arial", 10))
-        date_format_label.grid(row=0, column=0, sticky="w", pady=5)
+        date_format_label = tk.Label(date_frame, text="Date Sorting Level:", font=("Arial", 10))
+        date_format_label.grid(row=4, column=0, sticky="w", pady=(10, 0))
         
         format_options = [
             ("By Year (YYYY)", "year", "%Y"),
@@ -237,15 +674,16 @@ class FileOrganizerApp:
         ]
         
         for i, (text, value, _) in enumerate(format_options):
-            rb = tk.Radiobutton(date_format_frame, text=text, variable=self.date_format, value=value)
-            rb.grid(row=i, column=1, sticky="w")
+            rb = tk.Radiobutton(date_frame, text=text, variable=self.date_format, value=value)
+            rb.grid(row=4 + i, column=1, sticky="w", pady=(10, 0) if i == 0 else 0)
         
         # Date format preview
-        self.date_format_preview = tk.Label(date_format_frame, text="Example: " + self.get_date_format_example())
-        self.date_format_preview.grid(row=0, column=2, rowspan=3, padx=20)
+        self.date_format_preview = tk.Label(date_frame, text="Example: " + self.get_date_format_example())
+        self.date_format_preview.grid(row=4, column=2, rowspan=3, padx=20, pady=(10, 0))
         
-        # Update preview when format changes
-        self.date_format.trace_add("write", lambda *args: self.update_date_format_preview())
+        # Update preview when format changes (several writes in a row redraw once)
+        self._date_preview_pending = False
+        self.date_format.trace_add("write", self._schedule_date_format_preview)
 
         # Add another frame for category organization
         category_frame = tk.Frame(root)
@@ -260,7 +698,7 @@ class FileOrganizerApp:
         category_info.pack(anchor="w")
 
         # Add category list display
-        categories_text = ", ".join(list(self.category_definitions.keys()) + ["Other"])
+        categories_text = ", ".join((*self.category_definitions, "Other"))
         categories_display = tk.Label(category_frame, text=categories_text, font=("Arial", 9), 
                                      wraplength=550, justify="left")
         categories_display.pack(anchor="w", padx=10, pady=5)
@@ -284,10 +722,10 @@ class FileOrganizerApp:
         utils_label = tk.Label(buttons_frame, text="Utilities:", font=("Arial", 10, "bold"))
         utils_label.grid(row=2, column=0, columnspan=5, sticky="w", pady=(15, 10))
         
-        tk.Button(buttons_frame, text="Find Duplicates", command=self.find_duplicates,
-                  width=15, bg="#ffe0e0").grid(row=3, column=0, padx=10, pady=5)
-        ToolTip(tk.Button(buttons_frame, text="Find Duplicates", command=self.find_duplicates,
-                  width=15, bg="#ffe0e0"), "Find and manage duplicate files based on content")
+        duplicates_button = tk.Button(buttons_frame, text="Find Duplicates", command=self.find_duplicates,
+                                      width=15, bg="#ffe0e0")
+        duplicates_button.grid(row=3, column=0, padx=10, pady=5)
+        ToolTip(duplicates_button, "Find and manage duplicate files based on content")
 
         # Log frame
         log_frame = tk.Frame(root)
@@ -308,13 +746,46 @@ class FileOrganizerApp:
 
         self.preview = []
         
+        # Help windows by topic, built on first open and reused afterwards
+        self._help_windows = {}
+        
+        # Files found by the last folder count, as (folder, include_subfolders,
+        # top-level DirEntries, {subfolder name: DirEntries}, monotonic time,
+        # {directory: mtime}); reused by previews within SCAN_CACHE_TTL while no
+        # walked directory changed, and cleared before anything is moved or deleted.
+        # Clearing bumps the generation, so a count still running then doesn't
+        # store its outdated listing afterwards
+        self._scan_cache = None
+        self._scan_generation = 0
+        self._scan_cache_lock = threading.Lock()
+        
+        # Progress produced by the organize worker, pushed to the UI
+        # periodically by _flush_progress instead of once per file
+        self._progress_lock = threading.Lock()
+        self._progress_counter = 0
+        self._progress_total = 0
+        self._progress_active = False
+        
+        # Log messages queued by log() from any thread and written out in
+        # batches on the main thread by _drain_log
+        self._pending_log = deque()
+        self._log_drain_scheduled = False
+        
+        # Latest status bar text posted by post_status(); only the newest one
+        # is drawn when _drain_status runs
+        self._pending_status = None
+        self._status_drain_scheduled = False
+        
+        # Latest (message, value, maximum) for the processing dialog, drawn by
+        # _apply_dialog_update
+        self._pending_dialog_update = None
+        self._dialog_update_scheduled = False
+        
         # Bind window close event to save config
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         # Initial log message
         self.log("File Organizer started")
-        if not HAS_PIL:
-            self.log("WARNING: PIL/Pillow not installed. EXIF data extraction will not be available.")
         if self.path.get():
             self.log(f"Loaded last directory: {self.path.get()}")
     
@@ -324,24 +795,40 @@ class FileOrganizerApp:
             if path.startswith("//") or path.startswith("\\\\"):  # SMB path
                 # Just check if the path exists, but don't try to access it yet
                 return True
-            return os.path.exists(path)
+            return _path_exists_cached(path)
         except:
             return False
+
+    def has_pil(self):
+        """Check that Pillow can be used, logging a warning the first time it can't"""
+        if _get_pil():
+            return True
+        if not getattr(self, '_pil_warning_logged', False):
+            self._pil_warning_logged = True
+            self.log("WARNING: PIL/Pillow not installed. EXIF data extraction will not be available.")
+        return False
+
+    def _invalidate_path_cache(self):
+        """Forget cached path existence checks (called when the user browses again)"""
+        _path_exists_cache.clear()
     
     def get_date_format_example(self):
         """Get example of date format based on selection"""
-        today = datetime.now()
-        if self.date_format.get() == "year":
-            return today.strftime("%Y")
-        elif self.date_format.get() == "month":
-            return today.strftime("%Y-%m")
-        else:  # Default to day
-            return today.strftime("%Y-%m-%d")
+        # Default to day
+        format_date = self._DATE_FOLDER_FORMATS.get(self.date_format.get(), self._DATE_FOLDER_FORMATS["day"])
+        return format_date(datetime.now())
     
     def update_date_format_preview(self):
         """Update the date format preview label"""
+        self._date_preview_pending = False
         self.date_format_preview.config(text="Example: " + self.get_date_format_example())
     
+    def _schedule_date_format_preview(self, *args):
+        """date_format trace callback - update the preview once the event loop is idle"""
+        if not self._date_preview_pending:
+            self._date_preview_pending = True
+            self.root.after_idle(self.update_date_format_preview)
+    
     def on_recent_folder_selected(self, event):
         """Handle selection from recent folders dropdown"""
         folder = self.recent_var.get()
@@ -362,9 +849,8 @@ class FileOrganizerApp:
         """Add a folder to recent folders list, maintaining only the most recent 5"""
         if folder in self.recent_folders:
             self.recent_folders.remove(folder)
-        self.recent_folders.insert(0, folder)
-        # Keep only the 5 most recent folders
-        self.recent_folders = self.recent_folders[:5]
+        # The deque's maxlen drops the oldest folder beyond 5
+        self.recent_folders.appendleft(folder)
     
     def load_config(self):
         """Load configuration from file"""
@@ -385,11 +871,16 @@ class FileOrganizerApp:
                 "date_source": self.date_source.get(),
                 "date_format": self.date_format.get(),
                 "delete_empty_folders": self.delete_empty_folders.get(),
-                "recent_folders": self.recent_folders
+                "recent_folders": list(self.recent_folders),
+                "organized_folders": dict(self.organized_folders)
             }
             
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f)
+            # Nothing changed since the last save
+            if config == self._last_saved_config:
+                return
+            
+            _write_json_atomic(self.config_file, config)
+            self._last_saved_config = config
                 
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -397,19 +888,47 @@ class FileOrganizerApp:
     def on_closing(self):
         """Handle window closing event"""
         self.save_config()
+        self.save_metadata_cache()
+        self.save_geocode_cache()
         self.root.destroy()
 
     def log(self, message):
-        """Add a message to the log with timestamp"""
+        """Add a message to the log with timestamp (queued, so safe to call from worker threads)"""
+        self._pending_log.append(message)
+        if not self._log_drain_scheduled:
+            self._log_drain_scheduled = True
+            self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
+    
+    def _drain_log(self):
+        """Write queued log messages to the log widget, a bounded batch at a time"""
+        self._log_drain_scheduled = False
+        messages = []
+        while self._pending_log and len(messages) < LOG_DRAIN_BATCH:
+            messages.append(self._pending_log.popleft())
+        if messages:
+            self._write_log_lines(messages)
+        
+        # More queued than one batch - keep the UI responsive and continue shortly
+        if self._pending_log and not self._log_drain_scheduled:
+            self._log_drain_scheduled = True
+            self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
+
+    def _write_log_lines(self, messages):
+        """Add several messages to the log with a single insert"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
+        log_message = "".join(f"[{timestamp}] {message}\n" for message in messages)
         self.log_text.config(state="normal")
         self.log_text.insert(tk.END, log_message)
+        # Keep the widget from growing without bound over long sessions
+        excess = int(self.log_text.index("end-1c").split(".")[0]) - 1 - LOG_MAX_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
         self.log_text.see(tk.END)  # Scroll to the end
         self.log_text.config(state="disabled")
 
     def browse_folder(self):
         """Enhanced browse folder that supports direct input of network paths"""
+        self._invalidate_path_cache()
         initial_dir = self.last_directory
         if self.path.get():
             current_path = self.path.get()
@@ -486,70 +1005,195 @@ class FileOrganizerApp:
     def on_folder_selected(self, folder):
         """Handle a selected folder from any source"""
         if folder and self.is_valid_path(folder):
-            self.path.set(folder)
-            self.last_directory = folder
-            self.add_to_recent_folders(folder)
-            self.save_config()
-            
-            # Count files and update status bar
-            threading.Thread(
-                target=self._count_files_in_folder,
-                args=(folder,),
-                daemon=True
-            ).start()
-            self.log(f"Selected folder: {folder}")
+            if folder.startswith("//") or folder.startswith("\\\\"):  # SMB path
+                # Make sure the server answers first, off the UI thread
+                threading.Thread(target=self._probe_smb_folder, args=(folder,), daemon=True).start()
+                return
+            self._use_folder(folder)
+    
+    def _probe_smb_folder(self, folder):
+        """Select an SMB folder if its server accepts a connection within SMB_PROBE_TIMEOUT"""
+        host = self._smb_host(folder)
+        if not host:
+            # Nothing we can probe - let the folder through as before
+            self.root.after(0, self._use_folder, folder)
+            return
+        
+        for port in SMB_PORTS:
+            try:
+                socket.create_connection((host, port), timeout=SMB_PROBE_TIMEOUT).close()
+            except OSError:
+                continue
+            self.root.after(0, self._use_folder, folder)
+            return
+        
+        self.log(f"Cannot reach network server {host}")
+        self.root.after(0, lambda: messagebox.showwarning("Path Not Accessible",
+            f"The server '{host}' for '{folder}' did not respond.\n\n"
+            "Make sure it is switched on and reachable on your network."))
+    
+    def _smb_host(self, folder):
+        """Return the server name of an SMB path, without credentials or port"""
+        server = folder.replace("\\", "/").lstrip("/").split("/", 1)[0]
+        # //user:password@server/share
+        host = server.rpartition("@")[2]
+        if host.startswith("["):
+            # [IPv6 address]:port
+            return host[1:].partition("]")[0]
+        if host.count(":") == 1:
+            host = host.partition(":")[0]
+        return host
+    
+    def _use_folder(self, folder):
+        """Make folder the selected folder and count its files in the background"""
+        self.path.set(folder)
+        self.last_directory = folder
+        self.add_to_recent_folders(folder)
+        self.save_config()
+        
+        # Count files and update status bar
+        threading.Thread(
+            target=self._count_files_in_folder,
+            args=(folder,),
+            daemon=True
+        ).start()
+        self.log(f"Selected folder: {folder}")
+    
+    def post_status(self, text):
+        """Show text on the status bar (safe to call from worker threads)
+        
+        Texts posted in quick succession are coalesced; only the latest is drawn.
+        """
+        self._pending_status = text
+        if not self._status_drain_scheduled:
+            self._status_drain_scheduled = True
+            self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_status)
+    
+    def _drain_status(self):
+        """Draw the latest posted status bar text on the main thread"""
+        self._status_drain_scheduled = False
+        text, self._pending_status = self._pending_status, None
+        if text is not None:
+            self.status_label.config(text=text)
     
     def _count_files_in_folder(self, folder):
         """Count files in folder and update status bar"""
         try:
             # Show "Counting..." in status bar
-            self.root.after(0, lambda: self.status_label.config(text=f"Selected folder: {folder} (Counting files...)"))
+            self.post_status(f"Selected folder: {folder} (Counting files...)")
             
-            # Count files with or without subfolders
-            total_files = 0
-            total_size = 0
+            # Count files with or without subfolders; totals is [files, bytes]
+            totals = [0, 0]
+            totals_lock = threading.Lock()
+            counting_prefix = f"Selected folder: {folder} (Counting files... "
             
-            if self.include_subfolders.get():
-                for root, _, files in os.walk(folder):
-                    total_files += len(files)
-                    for file in files:
-                        try:
-                            file_path = os.path.join(root, file)
-                            total_size += os.path.getsize(file_path)
-                        except:
-                            pass
-            else:
-                for item in os.listdir(folder):
-                    item_path = os.path.join(folder, item)
-                    if os.path.isfile(item_path):
-                        total_files += 1
+            # Files directly in the folder are counted here; sizes come from the
+            # scandir entries, so no separate stat per path
+            self._invalidate_scan_cache()
+            generation = self._scan_generation
+            scanned_at = time.monotonic()
+            dir_mtimes = {folder: os.stat(folder).st_mtime_ns}
+            top_files = []
+            subfolders = []
+            recurse = self.include_subfolders.get()
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        top_files.append(entry)
+                        totals[0] += 1
                         try:
-                            total_size += os.path.getsize(item_path)
-                        except:
+                            totals[1] += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
                             pass
+                    elif recurse and entry.is_dir(follow_symlinks=False):
+                        subfolders.append(entry)
+            
+            # Each subfolder is counted in its own thread; report running totals
+            # at most every STATUS_UPDATE_INTERVAL until they all finish
+            subfolder_files = {}
+            if subfolders:
+                with ThreadPoolExecutor(max_workers=min(COUNT_WORKERS, len(subfolders))) as executor:
+                    futures = {executor.submit(self._count_subtree, entry.path, totals, totals_lock,
+                                               dir_mtimes): entry.name
+                               for entry in subfolders}
+                    pending = set(futures)
+                    while pending:
+                        done, pending = wait(pending, timeout=STATUS_UPDATE_INTERVAL)
+                        for future in done:
+                            subfolder_files[futures[future]] = future.result()
+                        if pending:
+                            self.post_status(f"{counting_prefix}{totals[0]} so far)")
+            total_files, total_size = totals
+            
+            # Keep the listing so the next preview of this folder doesn't walk it again,
+            # unless files started moving while it was taken
+            with self._scan_cache_lock:
+                if self._scan_generation == generation:
+                    self._scan_cache = (folder, recurse, top_files, subfolder_files, scanned_at, dir_mtimes)
             
             # Format size in human-readable format
             size_str = self.format_size(total_size)
             
             # Update status bar with count
-            self.root.after(0, lambda: self.status_label.config(
-                text=f"Selected folder: {folder} ({total_files} files, {size_str})"
-            ))
+            self.post_status(f"Selected folder: {folder} ({total_files} files, {size_str})")
             
         except Exception as e:
             self.log(f"Error counting files: {e}")
-            self.root.after(0, lambda: self.status_label.config(text=f"Selected folder: {folder}"))
+            self.post_status(f"Selected folder: {folder}")
+    
+    def _count_subtree(self, folder, totals, totals_lock, dir_mtimes):
+        """Add the number and size of files under folder to totals ([files, bytes])
+        
+        Returns the DirEntry objects of the files found; the mtime of each directory
+        walked is added to dir_mtimes.
+        """
+        found = []
+        files = size = 0
+        for entry in self.get_file_entries(folder, dir_mtimes=dir_mtimes):
+            found.append(entry)
+            files += 1
+            try:
+                size += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                pass
+            # Publish running totals in batches so the lock isn't taken per file
+            if files == 1000:
+                with totals_lock:
+                    totals[0] += files
+                    totals[1] += size
+                files = size = 0
+        with totals_lock:
+            totals[0] += files
+            totals[1] += size
+        return found
+    
+    def _scan_cache_fresh(self, scan_cache):
+        """Whether a folder count's listing is young enough and no directory in it changed
+        
+        Adding, removing or renaming a file changes its directory's mtime, so one stat
+        per directory stands in for walking the whole tree again.
+        """
+        if time.monotonic() - scan_cache[4] > SCAN_CACHE_TTL:
+            return False
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in scan_cache[5].items())
+        except OSError:
+            return False
+    
+    def _invalidate_scan_cache(self):
+        """Forget the file listing kept from the last folder count (files are moving)"""
+        with self._scan_cache_lock:
+            self._scan_generation += 1
+            self._scan_cache = None
     
     def format_size(self, size_bytes):
         """Format size in bytes to human readable format"""
         if size_bytes < 1024:
             return f"{size_bytes} bytes"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes/1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes/(1024*1024):.1f} MB"
-        else:
-            return f"{size_bytes/(1024*1024*1024):.2f} GB"
+        # Each unit is 10 more bits; GB is the largest unit shown
+        index = min((size_bytes.bit_length() - 1) // 10, len(self._SIZE_UNITS))
+        unit, decimals = self._SIZE_UNITS[index - 1]
+        return f"{size_bytes / (1 << (10 * index)):.{decimals}f} {unit}"
     
     def select_from_recent_list(self):
         """Show dialog to select from recent folders"""
@@ -585,9 +1229,8 @@ class FileOrganizerApp:
         scrollbar.config(command=listbox.yview)
         listbox.config(yscrollcommand=scrollbar.set)
         
-        # Add items
-        for folder in self.recent_folders:
-            listbox.insert(tk.END, folder)
+        # Add items (single insert call for all folders)
+        listbox.insert(tk.END, *self.recent_folders)
         
         # Select first item
         if listbox.size() > 0:
@@ -697,9 +1340,26 @@ class FileOrganizerApp:
         # Return the path if entered        
         return result[0]
 
+    def _show_cached_help(self, key):
+        """Bring back a help window built earlier; returns False if it must be built"""
+        window = self._help_windows.get(key)
+        if window is None or not window.winfo_exists():
+            return False
+        window.deiconify()
+        window.lift()
+        return True
+    
+    def _cache_help_window(self, key, window):
+        """Keep a help window for reuse - closing it hides it instead of destroying it"""
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        self._help_windows[key] = window
+
     def show_network_help(self):
         """Enhanced help for accessing network folders"""
+        if self._show_cached_help("network"):
+            return
         help_dialog = Toplevel(self.root)
+        self._cache_help_window("network", help_dialog)
         help_dialog.title("Network Share Help")
         help_dialog.geometry("600x450")
         
@@ -716,142 +1376,101 @@ class FileOrganizerApp:
         notebook = ttk.Notebook(help_dialog)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
         
-        # General tab
-        general_frame = ttk.Frame(notebook)
-        notebook.add(general_frame, text="General")
-        
-        general_text = Text(general_frame, wrap=tk.WORD, padx=10, pady=10)
-        general_text.pack(fill="both", expand=True)
-        general_text.insert(tk.END, """Network Share Access - General Information
-
-To access shared network folders (SMB/CIFS shares):
-
-1. Direct Entry: You can type a network path directly in the format:
-   • //server/share or \\\\server\\share
-
-2. Path with credentials (if needed):
-   • //username:password@server/share
-
-3. Common network path issues:
-   • Make sure the server is online and accessible from your network
-   • Verify you have permission to access the shared folder
-   • Some networks require you to be on the same LAN or VPN
-   • Firewalls may block SMB/CIFS traffic (ports 139 and 445)
-
-This application will attempt to access the path you provide. If connection 
-fails, you may need to first mount/map the drive using your operating system's 
-tools as described in the platform-specific tabs.
-""")
-        general_text.config(state="disabled")
-        
-        # Windows tab
-        windows_frame = ttk.Frame(notebook)
-        notebook.add(windows_frame, text="Windows")
-        
-        windows_text = Text(windows_frame, wrap=tk.WORD, padx=10, pady=10)
-        windows_text.pack(fill="both", expand=True)
-        windows_text.insert(tk.END, """Windows - Accessing Network Shares
-
-Method 1: Map a Network Drive
-1. Open File Explorer
-2. Right-click on "This PC" and select "Map network drive..."
-3. Choose a drive letter and enter the network path (\\\\server\\share)
-4. Check "Connect using different credentials" if needed
-5. Click "Finish" and enter credentials if prompted
-
-Method 2: Direct Access
-1. In File Explorer address bar, type \\\\server\\share
-2. Press Enter
-3. Enter credentials if prompted
-
-Troubleshooting:
-• Make sure Network Discovery is enabled
-• Check Windows Defender Firewall settings
-• Verify the remote computer is using SMB v1, v2, or v3 compatible with your Windows version
-• Try accessing with full credentials: \\\\username:password@server\\share
-""")
-        windows_text.config(state="disabled")
-        
-        # Linux tab
-        linux_frame = ttk.Frame(notebook)
-        notebook.add(linux_frame, text="Linux")
+        # One read-only tab per platform; each tab's text is only built the
+        # first time the tab is shown
+        tab_texts = {}
+        for tab_title, help_text in (("General", NETWORK_HELP_GENERAL), ("Windows", NETWORK_HELP_WINDOWS),
+                                     ("Linux", NETWORK_HELP_LINUX), ("macOS", NETWORK_HELP_MAC)):
+            tab_frame = ttk.Frame(notebook)
+            notebook.add(tab_frame, text=tab_title)
+            tab_texts[str(tab_frame)] = (tab_frame, help_text)
+        
+        def on_tab_changed(event=None):
+            tab_frame, help_text = tab_texts.pop(str(notebook.select()), (None, None))
+            if tab_frame is None:
+                return  # Already built
+            tab_text = Text(tab_frame, wrap=tk.WORD, padx=10, pady=10)
+            tab_text.pack(fill="both", expand=True)
+            tab_text.insert(tk.END, help_text)
+            tab_text.config(state="disabled")
+        
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+        on_tab_changed()
         
-        linux_text = Text(linux_frame, wrap=tk.WORD, padx=10, pady=10)
-        linux_text.pack(fill="both", expand=True)
-        linux_text.insert(tk.END, """Linux - Accessing Network Shares
-
-Method 1: Mount using terminal
-1. Create a mount point:
-   sudo mkdir -p /mnt/networkshare
-
-2. Mount the share:
-   sudo mount -t cifs //server/share /mnt/networkshare -o username=user,password=pass
-
-3. For permanent mounting, add to /etc/fstab:
-   //server/share /mnt/networkshare cifs username=user,password=pass,uid=1000,gid=1000 0 0
-
-Method 2: Using file manager
-Most Linux file managers support entering network paths directly:
-1. Open file manager (Nautilus, Dolphin, etc.)
-2. Press Ctrl+L to edit location
-3. Enter: smb://server/share
-4. Enter credentials when prompted
+        # Add close button        
+        tk.Button(help_dialog, text="Close", command=help_dialog.withdraw, width=10).pack(pady=10)
+    
+    def get_files(self, folder):
+        """Yield paths of regular files in folder (and subfolders if enabled)"""
+        for entry in self.get_file_entries(folder):
+            yield entry.path
 
-Prerequisites:
-• cifs-utils package must be installed:
-   Ubuntu/Debian: sudo apt install cifs-utils
-   Fedora/RHEL: sudo dnf install cifs-utils
-""")
-        linux_text.config(state="disabled")
+    def get_file_entries(self, folder, dir_mtimes=None, skip_dirs=()):
+        """Yield os.DirEntry objects for regular files in folder (and subfolders if enabled)
         
-        # macOS tab
-        mac_frame = ttk.Frame(notebook)
-        notebook.add(mac_frame, text="macOS")
+        If dir_mtimes is a dict, the mtime of each directory walked is stored in it,
+        taken before the directory is listed. Subfolders of folder itself whose path is
+        in skip_dirs (folders an earlier organize in this mode created) are not walked.
+        """
+        recurse = self.include_subfolders.get()
+        
+        # Reuse the listing from the folder count when it covers the same scan
+        # and is recent enough to still be accurate
+        scan_cache = self._scan_cache
+        if scan_cache is not None and scan_cache[:2] == (folder, recurse) and self._scan_cache_fresh(scan_cache):
+            yield from scan_cache[2]
+            for name, entries in scan_cache[3].items():
+                if os.path.join(folder, name) not in skip_dirs:
+                    yield from entries
+            return
         
-        mac_text = Text(mac_frame, wrap=tk.WORD, padx=10, pady=10)
-        mac_text.pack(fill="both", expand=True)
-        mac_text.insert(tk.END, """macOS - Accessing Network Shares
-
-Method 1: Using Finder
-1. In Finder, click "Go" menu and select "Connect to Server..." (or press ⌘K)
-2. Enter the server address: smb://server/share
-3. Click "Connect"
-4. Enter credentials when prompted
-
-Method 2: Using Terminal
-1. Create a mount point:
-   mkdir -p ~/NetworkShares/myshare
-
-2. Mount the share:
-   mount -t smbfs //username:password@server/share ~/NetworkShares/myshare
-
-Method 3: Auto-mount on login
-1. Open System Preferences
-2. Go to "Users & Groups"
-3. Select your account and click "Login Items"
-4. Add the network share to login items
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            at_top = current == folder
+            try:
+                if dir_mtimes is not None:
+                    dir_mtimes[current] = os.stat(current).st_mtime_ns
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry
+                        elif recurse and entry.is_dir(follow_symlinks=False):
+                            if at_top and entry.path in skip_dirs:
+                                continue
+                            stack.append(entry.path)
+            except OSError:
+                # Unreadable directory - skip it like os.walk does
+                continue
 
-Troubleshooting:
-• Make sure SMB is enabled in Sharing settings
-• Try different SMB versions: smb://server/share?SMB_VER=1.0
-• Check your macOS Firewall settings
-""")
-        mac_text.config(state="disabled")
-        
-        # Add close button        
-        tk.Button(help_dialog, text="Close", command=help_dialog.destroy, width=10).pack(pady=10)
+    def _organized_subfolders(self, folder, mode):
+        """Return the paths of folders an earlier organize in mode created directly in folder"""
+        skip_dirs = set()
+        for path, (created_by, inode) in list(self.organized_folders.items()):
+            if created_by != mode or os.path.dirname(path) != folder:
+                continue
+            try:
+                if os.stat(path).st_ino == inode:
+                    skip_dirs.add(path)
+            except OSError:
+                pass
+        if skip_dirs:
+            names = ", ".join(sorted(os.path.basename(path) for path in skip_dirs))
+            self.log(f"Not scanning folders created by an earlier organize by {mode}: {names}")
+        return skip_dirs
     
-    def get_files(self, folder):
-        files = []
-        for root, _, filenames in os.walk(folder):
-            for filename in filenames:
-                files.append(os.path.join(root, filename))
-            if not self.include_subfolders.get():
-                break
-        return files
-
-    def show_preview(self, preview):
+    def _remember_organized_folders(self, mode, folders):
+        """Record folders just created by an organize in mode (main thread)"""
+        for path in folders:
+            try:
+                self.organized_folders[path] = [mode, os.stat(path).st_ino]
+            except OSError:
+                pass
+        self.save_config()
+    
+    def show_preview(self, preview, mode=None):
         self.preview = preview
+        self.preview_mode = mode
         preview_window = Toplevel(self.root)
         preview_window.title("Preview")
         preview_window.geometry("700x500")
@@ -877,8 +1496,18 @@ Troubleshooting:
         tree.column("Destination", width=350)
         tree.pack(side="left", fill="both", expand=True)
         
-        for src, dst in preview:
-            tree.insert("", "end", values=(src, dst))
+        # Show the first rows right away and add the rest in batches from the
+        # event loop, so a large preview is usable before every row is in
+        def insert_rows(start, count):
+            if not tree.winfo_exists():
+                return
+            end = min(start + count, len(preview))
+            for src, dst in preview[start:end]:
+                tree.insert("", "end", values=(src, dst))
+            if end < len(preview):
+                self.root.after(10, insert_rows, end, PREVIEW_INSERT_BATCH)
+        
+        insert_rows(0, PREVIEW_FIRST_ROWS)
         
         # Button frame
         button_frame = tk.Frame(preview_window)
@@ -900,6 +1529,7 @@ Troubleshooting:
         # Store progress widgets in the instance for access from other methods
         self.progress_frame = progress_frame
         self.progress_bar = progress
+        self.progress_label = progress_label
         self.preview_window = preview_window
         
         cancel_button = tk.Button(button_frame, text="Cancel", command=preview_window.destroy)
@@ -962,67 +1592,107 @@ Troubleshooting:
         window.focus_force()
 
     def execute_organization_with_progress(self, window):
-        """Execute organization with progress updates"""
+        """Execute organization with progress updates (runs in a worker thread)"""
         if not self.preview:
-            messagebox.showerror("Error", "Please preview the changes first!")
+            self.root.after(0, lambda: messagebox.showerror("Error", "Please preview the changes first!"))
             return
 
         self.log(f"Starting organization of {len(self.preview)} files")
+        self._invalidate_scan_cache()
         success_count = 0
         skipped_count = 0
-        progress_value = 0
         
+        # Progress is batched and flushed every 100 ms; the total is kept apart
+        # from self.preview, which is cleared before the last flush runs
+        self._progress_counter = 0
+        self._progress_total = len(self.preview)
+        self._progress_active = True
+        self.root.after(0, self._flush_progress)
+        
+        # Separate out files that are already in place, splitting each destination once
+        moves = []
         for src, dst in self.preview:
+            dst_dir, dst_filename = os.path.split(dst)
+            if os.path.dirname(src) == dst_dir:
+                self.log(f"Skipped {os.path.basename(src)} - already in correct location")
+                skipped_count += 1
+            else:
+                moves.append((src, dst_dir, dst_filename))
+        with self._progress_lock:
+            self._progress_counter = skipped_count
+        
+        # Create each destination directory once instead of once per file
+        dst_dirs = {dst_dir for _, dst_dir, _ in moves}
+        created_dirs = []
+        for dst_dir in dst_dirs:
             try:
-                # Skip if source and destination directories are the same
-                if os.path.dirname(src) == os.path.dirname(dst):
-                    skip_message = f"Skipped {os.path.basename(src)} - already in correct location"
-                    self.status_label.config(text=skip_message)
-                    self.log(skip_message)
-                    skipped_count += 1
-                else:
-                    # Create destination directory if it doesn't exist
-                    dst_dir = os.path.dirname(dst)
+                if not os.path.isdir(dst_dir):
                     os.makedirs(dst_dir, exist_ok=True)
-                    
-                    # Get unique filename if needed
-                    dst_filename = os.path.basename(dst)
-                    if os.path.exists(dst):
-                        dst_filename = self.generate_unique_filename(dst_dir, dst_filename)
-                        self.log(f"Renamed {os.path.basename(dst)} to {dst_filename} to avoid conflict")
-                    
-                    # Move the file
-                    final_dst = os.path.join(dst_dir, dst_filename)
-                    shutil.move(src, final_dst)
-                    self.log(f"Moved: {src} -> {final_dst}")
-                    success_count += 1
+                    created_dirs.append(dst_dir)
             except Exception as e:
-                error_message = f"Error moving {src}: {e}"
-                self.log(f"ERROR: {error_message}")
-                # Using after() to schedule messagebox from the main thread
-                self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+                self.log(f"ERROR: Could not create {dst_dir}: {e}")
+        if created_dirs and self.preview_mode:
+            self.root.after(0, self._remember_organized_folders, self.preview_mode, created_dirs)
+        
+        # Names taken in each destination directory, listed once up front and
+        # extended as files are moved in, guarded by a per-directory lock so
+        # concurrent moves never pick the same name
+        dir_locks = {dst_dir: threading.Lock() for dst_dir in dst_dirs}
+        existing_names = {dst_dir: self._list_existing_names(dst_dir) for dst_dir in dst_dirs}
+        
+        def move_one(src, dst_dir, dst_filename):
+            with dir_locks[dst_dir]:
+                final_filename = self.generate_unique_filename(dst_dir, dst_filename,
+                                                               existing_names[dst_dir])
             
-            # Update progress
-            progress_value += 1
-            # Use after() to safely update the progress from the main thread
-            self.root.after(0, lambda v=progress_value: self.update_progress(v))
-            
-            # Update every 10 files processed or give the UI a chance to update
-            if progress_value % 10 == 0:
-                time.sleep(0.01)  # Brief pause to allow UI to update
+            # Move the file, taking the next free name if one appeared since the listing
+            while True:
+                final_dst = os.path.join(dst_dir, final_filename)
+                try:
+                    self._move_file(src, final_dst)
+                    break
+                except FileExistsError:
+                    with dir_locks[dst_dir]:
+                        final_filename = self.generate_unique_filename(dst_dir, dst_filename,
+                                                                       existing_names[dst_dir])
+            if final_filename != dst_filename:
+                self.log(f"Renamed {dst_filename} to {final_filename} to avoid conflict")
+            self.log(f"Moved: {src} -> {final_dst}")
+        
+        # Moves are I/O bound, so run several at once
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(move_one, *move): move[0] for move in moves}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    success_count += 1
+                except Exception as e:
+                    error_message = f"Error moving {futures[future]}: {e}"
+                    self.log(f"ERROR: {error_message}")
+                    # Using after() to schedule messagebox from the main thread
+                    self.root.after(0, lambda m=error_message: messagebox.showerror("Error", m))
+                
+                # Update progress (picked up by _flush_progress on the main thread)
+                with self._progress_lock:
+                    self._progress_counter += 1
         
         # Delete empty folders if option is enabled
         if self.delete_empty_folders.get():
             self.log("Checking for empty folders to delete...")
             self.remove_empty_dirs(self.path.get())
         
-        message = f"Successfully organized {success_count} of {len(self.preview)} files! Skipped {skipped_count} files."
-        self.status_label.config(text=message)
+        message = f"Successfully organized {success_count} of {self._progress_total} files! Skipped {skipped_count} files."
+        self.post_status(message)
         self.log(message)
         
+        # Stop the periodic flush and push the final count
+        self._progress_active = False
+        self.root.after(0, self._flush_progress)
+        
         # Using after() to schedule messagebox from the main thread
+        total = self._progress_total
         self.root.after(0, lambda: messagebox.showinfo("Success", 
-                            f"Successfully organized {success_count} of {len(self.preview)} files!\n"
+                            f"Successfully organized {success_count} of {total} files!\n"
                             f"Skipped {skipped_count} files (already in correct location)"))
         
         # Close the window after completion                    
@@ -1031,27 +1701,176 @@ Troubleshooting:
         # Clear the preview        
         self.preview = []
 
+    def _flush_progress(self):
+        """Push batched progress from the organize worker to the UI"""
+        with self._progress_lock:
+            value = self._progress_counter
+        
+        try:
+            if self.progress_bar.winfo_exists():
+                self.update_progress(value)
+        except (AttributeError, tk.TclError):
+            # Preview window already closed
+            pass
+        
+        if self._progress_active:
+            self.root.after(100, self._flush_progress)
+
     def update_progress(self, value):
         """Update the progress bar"""
         if hasattr(self, 'progress_bar'):
             self.progress_bar["value"] = value
             
             # Calculate percentage
-            percentage = int((value / len(self.preview)) * 100)
-            self.progress_bar.master.nametowidget(self.progress_bar.master.winfo_children()[0].winfo_name()).config(
-                text=f"Progress: {percentage}%")
+            total = self._progress_total
+            percentage = int((value / total) * 100) if total else 100
+            self.progress_label.config(text=f"Progress: {percentage}%")
+        
+    def _move_file(self, src, dst):
+        """Move a file without ever replacing an existing file at dst
+        
+        Uses a plain rename when source and destination share a filesystem. Raises
+        FileExistsError if dst is taken, so the caller can pick another name.
+        """
+        try:
+            self._rename_no_replace(src, dst)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        
+        # Different volume on Windows - the system copies and removes the source for us
+        if _MoveFileExW is not None:
+            if _MoveFileExW(src, dst, MOVEFILE_COPY_ALLOWED | MOVEFILE_WRITE_THROUGH):
+                return
+            if ctypes.get_last_error() in (ERROR_FILE_EXISTS, ERROR_ALREADY_EXISTS):
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
         
-    def generate_unique_filename(self, destination, filename):
-        """Generate a unique filename if the original file already exists at the destination"""
+        # Different filesystem - copy then delete the source
+        try:
+            self._fast_copy(src, dst)
+        except FileExistsError:
+            raise
+        except OSError:
+            copied = False
+        else:
+            try:
+                shutil.copystat(src, dst)
+                copied = True
+            except OSError:
+                os.remove(dst)
+                copied = False
+        if not copied:
+            # Kernel copy not possible here - let shutil handle the whole move
+            if os.path.lexists(dst):
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+            shutil.move(src, dst)
+            return
+        os.remove(src)
+
+    def _rename_no_replace(self, src, dst):
+        """Rename src to dst on the same filesystem, raising FileExistsError if dst exists"""
+        if os.name == "nt":
+            # Windows rename already refuses to replace an existing file
+            os.rename(src, dst)
+            return
+        
+        # A hard link fails atomically if dst exists, unlike rename on POSIX
+        try:
+            os.link(src, dst)
+        except FileExistsError:
+            raise
+        except OSError as e:
+            if e.errno == errno.EXDEV:
+                raise
+            # No hard links here (FAT, some network shares) - check, then rename
+            if os.path.lexists(dst):
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+            os.rename(src, dst)
+            return
+        try:
+            os.unlink(src)
+        except OSError:
+            # Leave the file where it was rather than in both places
+            os.unlink(dst)
+            raise
+
+    def _fast_copy(self, src, dst):
+        """Copy file contents with kernel-side primitives where available
+        
+        Tries, in order: a FICLONE reflink, os.copy_file_range, os.sendfile, and finally
+        a regular buffered copy.
+        """
+        with open(src, 'rb') as fsrc, open(dst, 'xb') as fdst:
+            # 'x' never overwrites a file that appeared at dst; a failed copy is removed
+            try:
+                src_fd = fsrc.fileno()
+                dst_fd = fdst.fileno()
+            
+                # Reflink - instant on copy-on-write filesystems
+                if fcntl is not None:
+                    try:
+                        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                        return
+                    except OSError:
+                        pass
+            
+                # In-kernel copy without going through Python buffers
+                size = os.fstat(src_fd).st_size
+                for method in ("copy_file_range", "sendfile"):
+                    if not hasattr(os, method):
+                        continue
+                    offset = 0
+                    try:
+                        while offset < size:
+                            if method == "copy_file_range":
+                                copied = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+                            else:
+                                copied = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                            if not copied:
+                                break
+                            offset += copied
+                    except OSError:
+                        pass
+                    if offset == size:
+                        return
+                    # Incomplete - discard and try the next method
+                    os.ftruncate(dst_fd, 0)
+            
+                fsrc.seek(0)
+                fdst.seek(0)
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+            except BaseException:
+                fdst.close()
+                os.remove(dst)
+                raise
+
+    def generate_unique_filename(self, destination, filename, existing=None):
+        """Generate a unique filename if the original file already exists at the destination
+        
+        existing is the set from _list_existing_names for destination; pass the same set
+        across calls to avoid listing the directory again. The returned name is added to it.
+        Names are compared ignoring case on Windows and macOS, whose filesystems do.
+        """
+        if existing is None:
+            existing = self._list_existing_names(destination)
         base, ext = os.path.splitext(filename)
         counter = 1
         new_filename = filename
         
-        while os.path.exists(os.path.join(destination, new_filename)):
+        while _name_key(new_filename) in existing:
             new_filename = f"{base} ({counter}){ext}"
             counter += 1
         
+        existing.add(_name_key(new_filename))
         return new_filename
+    
+    def _list_existing_names(self, destination):
+        """Return the names in destination as a set for conflict checks (see _name_key)"""
+        try:
+            return {_name_key(name) for name in os.listdir(destination)}
+        except OSError:
+            return set()
 
     def preview_by_type(self):
         folder = self.path.get()
@@ -1075,24 +1894,32 @@ Troubleshooting:
         """Generate preview by file type in a background thread"""
         try:
             preview = []
-            # Get files with progress updates
-            files = self.get_files_with_progress(folder)
+            self.update_processing_dialog("Scanning files...", 0, None)
             
-            total_files = len(files)
-            self.update_processing_dialog(f"Processing {total_files} files...", 0, total_files)
+            # Destination folder for each extension, built once per extension
+            ext_folders = {}
             
-            # Process files
-            for i, file_path in enumerate(files):
-                if os.path.isfile(file_path):
-                    ext = os.path.splitext(file_path)[1][1:] or "NO_EXTENSION"
-                    ext_folder = os.path.join(folder, ext.upper())
-                    dest_path = os.path.join(ext_folder, os.path.basename(file_path))
-                    preview.append((file_path, dest_path))
+            # Don't walk back into folders an earlier organize by type created here
+            skip_dirs = self._organized_subfolders(folder, "type")
+            
+            # Stream files straight from the directory walk - no intermediate file list
+            for i, entry in enumerate(self.get_file_entries(folder, skip_dirs=skip_dirs)):
+                name = entry.name
+                ext = _file_extension(name)[1:] or "NO_EXTENSION"
+                ext_folder = ext_folders.get(ext)
+                if ext_folder is None:
+                    ext_folder = ext_folders[ext] = os.path.join(folder, ext.upper())
+                preview.append((entry.path, os.path.join(ext_folder, name)))
                 
-                # Update progress every 10 files
-                if i % 10 == 0:
-                    self.update_processing_dialog(f"Processing files... ({i}/{total_files})", i, total_files)
+                # Update progress every 100 files
+                if i % 100 == 0:
+                    self.update_processing_dialog(f"Processing files... ({i + 1} found)", i + 1, None)
+                
+                # Check for cancel
+                if self.cancel_scan:
+                    raise InterruptedError("File scanning was cancelled")
             
+            total_files = len(preview)
             # Final progress update
             self.update_processing_dialog("Finalizing preview...", total_files, total_files)
             
@@ -1104,89 +1931,61 @@ Troubleshooting:
                 return
             
             # Show preview window on main thread
-            self.root.after(0, lambda p=list(preview): self.show_preview(p))
+            self.root.after(0, self.show_preview, preview, "type")
             message = f"Preview ready: {len(preview)} files to organize by type"
-            self.root.after(0, lambda: self.status_label.config(text=message))
+            self.post_status(message)
             self.log(message)
             
             # Close progress dialog
             self.close_processing_dialog()
             
+        except InterruptedError:
+            self.log("Preview generation was cancelled by user")
+            self.close_processing_dialog()
+            
         except Exception as e:
             self.log(f"Error generating preview: {str(e)}")
-            import traceback
             self.log(traceback.format_exc())
             self.close_processing_dialog()
             self.root.after(0, lambda: messagebox.showerror("Error", 
                                                         f"An error occurred while generating preview:\n\n{str(e)}"))
 
     def get_files_with_progress(self, folder):
-        """Get files with progress updates for large directories"""
-        files = []
-        self.cancel_scan = False
+        """Get paths of regular files (no symlinks) with progress updates for large directories
         
-        # First, count files to set up progress
-        if self.include_subfolders.get():
-            # First pass to count files
-            self.update_processing_dialog("Counting files...", 0, 100)
-            total_files = 0
-            for _, _, filenames in os.walk(folder):
-                total_files += len(filenames)
-                
-                # Check for cancel
-                if self.cancel_scan:
-                    raise InterruptedError("File scanning was cancelled")
-                
-                # Give the UI a chance to update
-                if total_files % 1000 == 0:
-                    self.update_processing_dialog(f"Counting files... {total_files} found", 0, 100)
-                    time.sleep(0.01)
-        else:
-            # Single directory count is fast
-            filenames = [f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))]
-            total_files = len(filenames)
+        Callers don't need to check the paths again with os.path.isfile.
+        """
+        return [entry.path for entry in self.get_file_entries_with_progress(folder)]
+    
+    def get_file_entries_with_progress(self, folder):
+        """List os.DirEntry objects for regular files with progress updates for large directories
         
-        # Update with accurate count
-        self.update_processing_dialog(f"Found {total_files} files. Preparing file list...", 0, total_files)
-        
-        # Get the actual files with progress updates
-        file_count = 0
-        if self.include_subfolders.get():
-            for root, _, filenames in os.walk(folder):
-                for filename in filenames:
-                    files.append(os.path.join(root, filename))
-                    file_count += 1
-                    
-                    # Update progress periodically
-                    if file_count % 100 == 0:
-                        self.update_processing_dialog(f"Preparing file list... {file_count}/{total_files}", 
-                                   file_count, total_files)
-                    
-                    # Check for cancel
-                    if self.cancel_scan:
-                        raise InterruptedError("File scanning was cancelled")
-        else:
-            # Single directory
-            for filename in os.listdir(folder):
-                file_path = os.path.join(folder, filename)
-                if os.path.isfile(file_path):
-                    files.append(file_path)
-                    file_count += 1
-                    
-                    # Update progress periodically
-                    if file_count % 100 == 0:
-                        self.update_processing_dialog(f"Preparing file list... {file_count}/{total_files}", 
-                                   file_count, total_files)
-                    
-                    # Check for cancel
-                    if self.cancel_scan:
-                        raise InterruptedError("File scanning was cancelled")
+        The tree is walked once; the total isn't known until the walk ends, so the
+        progress bar is indeterminate meanwhile.
+        """
+        entries = []
+        self.cancel_scan = False
+        self.update_processing_dialog("Scanning files...", 0, None)
         
-        return files
+        for entry in self.get_file_entries(folder):
+            entries.append(entry)
+            
+            # Update progress periodically
+            if len(entries) % 1000 == 0:
+                self.update_processing_dialog(f"Scanning files... {len(entries)} found", 0, None)
+            
+            # Check for cancel
+            if self.cancel_scan:
+                raise InterruptedError("File scanning was cancelled")
+        
+        # Update with accurate count
+        self.update_processing_dialog(f"Found {len(entries)} files.", 0, len(entries))
+        return entries
 
     def show_processing_dialog(self, title, message):
         """Show a processing dialog with progress bar"""
         # Create a global reference to the dialog
+        self._pending_dialog_update = None  # Left over from an earlier dialog
         self.processing_dialog = Toplevel(self.root)
         self.processing_dialog.title(title)
         self.processing_dialog.geometry("400x120")
@@ -1217,12 +2016,40 @@ Troubleshooting:
         ).pack(pady=10)
     
     def update_processing_dialog(self, message, value, maximum):
-        """Update the processing dialog from the main thread"""
-        if not hasattr(self, 'processing_dialog') or not self.processing_dialog.winfo_exists():
+        """Update the processing dialog (safe to call from worker threads)
+        
+        Pass maximum=None when the total is not known yet (streaming scans) to show
+        an indeterminate progress bar. Updates posted in quick succession are
+        coalesced; only the latest is drawn.
+        """
+        self._pending_dialog_update = (message, value, maximum)
+        if not self._dialog_update_scheduled:
+            self._dialog_update_scheduled = True
+            self.root.after(DIALOG_UPDATE_INTERVAL_MS, self._apply_dialog_update)
+    
+    def _apply_dialog_update(self):
+        """Draw the latest processing dialog update on the main thread"""
+        self._dialog_update_scheduled = False
+        update, self._pending_dialog_update = self._pending_dialog_update, None
+        if update is None or not hasattr(self, 'processing_dialog') or not self.processing_dialog.winfo_exists():
             return
-            
-        self.root.after(0, lambda: self.progress_message.set(message))
-        self.root.after(0, lambda: self.progress_bar_dialog.configure(maximum=maximum, value=value))
+        message, value, maximum = update
+        self.progress_message.set(message)
+        self._set_processing_progress(value, maximum)
+    
+    def _set_processing_progress(self, value, maximum):
+        """Set the processing dialog progress bar, switching to indeterminate mode if maximum is None"""
+        if not self.processing_dialog.winfo_exists():
+            return
+        bar = self.progress_bar_dialog
+        if maximum is None:
+            if str(bar["mode"]) != "indeterminate":
+                bar.configure(mode="indeterminate")
+                bar.start(10)
+        else:
+            if str(bar["mode"]) != "determinate":
+                bar.stop()
+            bar.configure(mode="determinate", maximum=maximum, value=value)
     
     def close_processing_dialog(self):
         """Close the processing dialog"""
@@ -1259,31 +2086,37 @@ Troubleshooting:
         try:
             preview = []
             # Count files in each category for logging
-            category_counts = {}
+            category_counts = defaultdict(int)
             
-            # Get files with progress updates
-            files = self.get_files_with_progress(folder)
+            self.update_processing_dialog("Scanning files...", 0, None)
             
-            total_files = len(files)
-            self.update_processing_dialog(f"Processing {total_files} files...", 0, total_files)
+            # Destination folder for each category, built once per category
+            category_folders = {}
             
-            # Process files
-            for i, file_path in enumerate(files):
-                if os.path.isfile(file_path):
-                    category = self.get_file_category(file_path)
-                    # Keep track of how many files in each category
-                    if category not in category_counts:
-                        category_counts[category] = 0
-                    category_counts[category] += 1
-                    
-                    category_folder = os.path.join(folder, category)
-                    dest_path = os.path.join(category_folder, os.path.basename(file_path))
-                    preview.append((file_path, dest_path))
+            # Don't walk back into folders an earlier organize by category created here
+            skip_dirs = self._organized_subfolders(folder, "category")
+            
+            # Stream files straight from the directory walk - no intermediate file list
+            for i, entry in enumerate(self.get_file_entries(folder, skip_dirs=skip_dirs)):
+                name = entry.name
+                category = self.get_file_category(name)
+                # Keep track of how many files in each category
+                category_counts[category] += 1
                 
-                # Update progress every 10 files
-                if i % 10 == 0:
-                    self.update_processing_dialog(f"Processing files... ({i}/{total_files})", i, total_files)
+                category_folder = category_folders.get(category)
+                if category_folder is None:
+                    category_folder = category_folders[category] = os.path.join(folder, category)
+                preview.append((entry.path, os.path.join(category_folder, name)))
+                
+                # Update progress every 100 files
+                if i % 100 == 0:
+                    self.update_processing_dialog(f"Processing files... ({i + 1} found)", i + 1, None)
+                
+                # Check for cancel
+                if self.cancel_scan:
+                    raise InterruptedError("File scanning was cancelled")
             
+            total_files = len(preview)
             # Final progress update
             self.update_processing_dialog("Finalizing preview...", total_files, total_files)
             
@@ -1300,17 +2133,20 @@ Troubleshooting:
                 self.log(f"  {category}: {count} files")
             
             # Show preview window on main thread
-            self.root.after(0, lambda p=list(preview): self.show_preview(p))
+            self.root.after(0, self.show_preview, preview, "category")
             message = f"Preview ready: {len(preview)} files to organize by category"
-            self.root.after(0, lambda: self.status_label.config(text=message))
+            self.post_status(message)
             self.log(message)
             
             # Close progress dialog
             self.close_processing_dialog()
             
+        except InterruptedError:
+            self.log("Preview generation was cancelled by user")
+            self.close_processing_dialog()
+            
         except Exception as e:
             self.log(f"Error generating preview: {str(e)}")
-            import traceback
             self.log(traceback.format_exc())
             self.close_processing_dialog()
             self.root.after(0, lambda: messagebox.showerror("Error", 
@@ -1340,31 +2176,42 @@ Troubleshooting:
         try:
             preview = []
             
-            # Get date format pattern based on selection
-            date_format = {
-                "year": "%Y",
-                "month": "%Y-%m",
-                "day": "%Y-%m-%d"
-            }.get(self.date_format.get(), "%Y-%m-%d")
+            # Get date folder name builder based on selection
+            format_date = self._DATE_FOLDER_FORMATS.get(self.date_format.get(),
+                                                        self._DATE_FOLDER_FORMATS["day"])
+            date_folders = {}  # Folder name -> full path, joined once per name
             
-            # Get files with progress updates
-            files = self.get_files_with_progress(folder)
+            # Get files with progress updates; the scandir entries carry (or
+            # cache) each file's stat for the file date fallback
+            entries = self.get_file_entries_with_progress(folder)
+            
+            total_files = len(entries)
+            
+            # Read EXIF dates up front, concurrently
+            exif_dates = self._read_exif_dates([entry.path for entry in entries])
             
-            total_files = len(files)
             self.update_processing_dialog(f"Processing {total_files} files...", 0, total_files)
             
-            # Process files
-            for i, file_path in enumerate(files):
-                if os.path.isfile(file_path):
-                    # Update dialog for EXIF processing
-                    if i % 5 == 0:  # More frequent updates for date extraction
-                        self.update_processing_dialog(f"Processing {os.path.basename(file_path)}... ({i}/{total_files})", 
-                                                    i, total_files)
-                    
-                    file_date = self.get_file_date(file_path)
-                    date_folder = os.path.join(folder, file_date.strftime(date_format))
-                    dest_path = os.path.join(date_folder, os.path.basename(file_path))
-                    preview.append((file_path, dest_path))
+            # Process files (all regular files already - the scan checked their type)
+            for i, entry in enumerate(entries):
+                file_path = entry.path
+                # Update dialog for EXIF processing
+                if i % 5 == 0:  # More frequent updates for date extraction
+                    self.update_processing_dialog(f"Processing {entry.name}... ({i}/{total_files})", 
+                                                i, total_files)
+                
+                try:
+                    file_date = self.get_file_date(file_path, exif_dates, entry)
+                except OSError as e:
+                    # Removed since the folder was scanned
+                    self.log(f"Skipping {file_path}: {e}")
+                    continue
+                folder_name = format_date(file_date)
+                date_folder = date_folders.get(folder_name)
+                if date_folder is None:
+                    date_folder = date_folders[folder_name] = os.path.join(folder, folder_name)
+                dest_path = os.path.join(date_folder, entry.name)
+                preview.append((file_path, dest_path))
                 
             # Final progress update    
             self.update_processing_dialog("Finalizing preview...", total_files, total_files)
@@ -1377,17 +2224,20 @@ Troubleshooting:
                 return
             
             # Show preview window on main thread
-            self.root.after(0, lambda p=list(preview): self.show_preview(p))
+            self.root.after(0, self.show_preview, preview)
             message = f"Preview ready: {len(preview)} files to organize by date"
-            self.root.after(0, lambda: self.status_label.config(text=message))
+            self.post_status(message)
             self.log(message)
             
             # Close progress dialog
             self.close_processing_dialog()
             
+        except InterruptedError:
+            self.log("Preview generation was cancelled by user")
+            self.close_processing_dialog()
+            
         except Exception as e:
             self.log(f"Error generating preview: {str(e)}")
-            import traceback
             self.log(traceback.format_exc())
             self.close_processing_dialog()
             self.root.after(0, lambda: messagebox.showerror("Error", 
@@ -1416,32 +2266,44 @@ Troubleshooting:
         """Find duplicate files in a background thread"""
         try:
             # Get files with progress updates
-            files = self.get_files_with_progress(folder)
+            entries = self.get_file_entries_with_progress(folder)
             
-            if not files:
+            if not entries:
                 self.close_processing_dialog()
                 message = "No files found to check for duplicates!"
                 self.root.after(0, lambda: messagebox.showinfo("No Files", message))
                 self.log(message)
                 return
             
+            # Group files by size first - a file whose size no other file has can't
+            # have a duplicate, so it is never read
+            files_by_size = defaultdict(list)
+            for entry in entries:
+                try:
+                    file_size = entry.stat(follow_symlinks=False).st_size
+                except OSError as e:
+                    self.log(f"Error processing {entry.path}: {e}")
+                    continue
+                # Skip large files (over 100MB) by default
+                if file_size > 100 * 1024 * 1024:
+                    self.log(f"Skipping large file: {entry.path} ({self.format_size(file_size)})")
+                    continue
+                files_by_size[file_size].append(entry.path)
+            files = [file_path for same_size in files_by_size.values() if len(same_size) > 1
+                     for file_path in same_size]
+            
             # Update progress dialog
             total_files = len(files)
+            self.log(f"{total_files} of {len(entries)} files share their size with another file")
             self.update_processing_dialog(f"Calculating checksums for {total_files} files...", 0, total_files)
             
             # Dictionary to store file checksums
             # Key: checksum, Value: list of file paths with that checksum
-            file_hashes = {}
+            file_hashes = defaultdict(list)
             
             # For each file, calculate its MD5 hash and store in the dictionary
             for i, file_path in enumerate(files):
                 try:
-                    # Skip large files (over 100MB) by default
-                    file_size = os.path.getsize(file_path)
-                    if file_size > 100 * 1024 * 1024:
-                        self.log(f"Skipping large file: {file_path} ({self.format_size(file_size)})")
-                        continue
-                    
                     # Update progress dialog
                     if i % 10 == 0:
                         self.update_processing_dialog(f"Processing file {i+1} of {total_files}...", 
@@ -1455,8 +2317,6 @@ Troubleshooting:
                         continue
                         
                     # Store file hash
-                    if file_hash not in file_hashes:
-                        file_hashes[file_hash] = []
                     file_hashes[file_hash].append(file_path)
                     
                 except Exception as e:
@@ -1491,7 +2351,6 @@ Troubleshooting:
             
         except Exception as e:
             self.log(f"Error finding duplicates: {e}")
-            import traceback
             self.log(traceback.format_exc())
             self.close_processing_dialog()
             self.root.after(0, lambda: messagebox.showerror("Error", 
@@ -1499,7 +2358,6 @@ Troubleshooting:
 
     def _calculate_file_hash(self, file_path, block_size=65536):
         """Calculate MD5 hash for a file"""
-        import hashlib
         try:
             md5 = hashlib.md5()
             with open(file_path, 'rb') as f:
@@ -1605,12 +2463,13 @@ Troubleshooting:
                 check.select_var = var
                 
                 # New: if file is an image and PIL is available, add a thumbnail
-                if HAS_PIL and file_path.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.bmp')):
+                if self.has_pil() and file_path.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.bmp')):
                     try:
-                        image = Image.open(file_path)
-                        # Increase thumbnail size for better preview
-                        image.thumbnail((100,100), Image.LANCZOS)
-                        photo = ImageTk.PhotoImage(image)
+                        # Close the file as soon as the thumbnail has been copied to Tk
+                        with Image.open(file_path) as image:
+                            # Increase thumbnail size for better preview
+                            image.thumbnail((100,100), Image.LANCZOS)
+                            photo = ImageTk.PhotoImage(image)
                         self.duplicate_thumbnails[file_path] = photo  # Store reference
                         thumb_label = tk.Label(top_row, image=photo)
                         thumb_label.pack(side="left", padx=5)
@@ -1674,6 +2533,7 @@ Troubleshooting:
                 return
                 
             # Delete files
+            self._invalidate_scan_cache()
             deleted_count = 0
             for file_path in selected_files:
                 try:
@@ -1723,6 +2583,7 @@ Troubleshooting:
                 return
                 
             # Delete the selected files
+            self._invalidate_scan_cache()
             total_deleted = 0
             for file_path in selected_files:
                 try:
@@ -1801,7 +2662,7 @@ Troubleshooting:
 
     def show_image_preview(self, image_path):
         """Show a preview of an image"""
-        if not HAS_PIL:
+        if not self.has_pil():
             messagebox.showinfo("Missing Dependency", "Pillow (PIL) is required for image preview.")
             return
             
@@ -1818,27 +2679,27 @@ Troubleshooting:
             y = (preview.winfo_screenheight() - preview.winfo_height()) // 2
             preview.geometry(f"+{x}+{y}")
             
-            # Load the image
-            image = Image.open(image_path)
-            
-            # Calculate dimensions to fit in window while preserving aspect ratio
-            max_width = 750  # Leave some margin for the window border
-            max_height = 520  # Leave space for the close button and margins
-            
-            # Get original image dimensions
-            img_width, img_height = image.size
-            
-            # Calculate scaling factor to fit within window
-            width_ratio = max_width / img_width
-            height_ratio = max_height / img_height
-            scale_factor = min(width_ratio, height_ratio)
-            
-            # Resize if image is larger than the available space
-            if scale_factor < 1:
-                new_width = int(img_width * scale_factor)
-                new_height = int(img_height * scale_factor)
-                image = image.resize((new_width, new_height), Image.LANCZOS)
-            photo = ImageTk.PhotoImage(image)
+            # Load the image; the file is closed once Tk has its own copy
+            with Image.open(image_path) as image:
+                # Calculate dimensions to fit in window while preserving aspect ratio
+                max_width = 750  # Leave some margin for the window border
+                max_height = 520  # Leave space for the close button and margins
+                
+                # Get original image dimensions
+                img_width, img_height = image.size
+                
+                # Calculate scaling factor to fit within window
+                width_ratio = max_width / img_width
+                height_ratio = max_height / img_height
+                scale_factor = min(width_ratio, height_ratio)
+                
+                # Resize if image is larger than the available space
+                if scale_factor < 1:
+                    new_width = int(img_width * scale_factor)
+                    new_height = int(img_height * scale_factor)
+                    photo = ImageTk.PhotoImage(image.resize((new_width, new_height), Image.LANCZOS))
+                else:
+                    photo = ImageTk.PhotoImage(image)
             
             # Create a label to display the image
             label = tk.Label(preview, image=photo)
@@ -1853,24 +2714,12 @@ Troubleshooting:
 
     def get_date_from_filename(self, filename):
         """Try to extract a date from filename patterns like YYYYMMDD, YYYY-MM-DD, etc."""
-        # Common date patterns in filenames
-        patterns = [
-            # YYYY-MM-DD or YYYY_MM_DD
-            r'(?P<year>\d{4})[-_](?P<month>\d{2})[-_](?P<day>\d{2})',
-            # YYYYMMDD
-            r'(?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})',
-            # DD-MM-YYYY or DD_MM_YYYY
-            r'(?P<day>\d{2})[-_](?P<month>\d{2})[-_](?P<year>\d{4})',
-            # MM-DD-YYYY or MM_DD_YYYY
-            r'(?P<month>\d{2})[-_](?P<day>\d{2})[-_](?P<year>\d{4})',
-            # Common camera/phone formats like IMG_20181216_140830
-            r'IMG[_-](?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})[_-]',
-            # Generic pattern for finding dates anywhere in the filename
-            r'(?<!\d)(?P<year>20\d{2})(?P<month>0[1-9]|1[0-2])(?P<day>[0-3]\d)(?!\d)',
-        ]
+        # One linear scan rules out most filenames before trying each pattern
+        if not self._YEAR_PREFILTER.search(filename):
+            return None
         
-        for pattern in patterns:
-            match = re.search(pattern, filename)
+        for pattern in self._DATE_PATTERNS:
+            match = pattern.search(filename)
             if match:
                 try:
                     year = int(match.group('year'))
@@ -1890,114 +2739,177 @@ Troubleshooting:
 
     def get_date_from_exif(self, file_path):
         """Extract date from image EXIF data if available"""
-        if not HAS_PIL:
+        if not self.has_pil():
             return None
             
         try:
-            if not file_path.lower().endswith(('.jpg', '.jpeg', '.tiff', '.png')):
-                return None
-                
-            image = Image.open(file_path)
-            if not hasattr(image, '_getexif') or image._getexif() is None:
+            if not file_path.lower().endswith(EXIF_DATE_EXTENSIONS):
                 return None
-                
-            exif_data = {
-                TAGS.get(tag, tag): value
-                for tag, value in image._getexif().items()
-            }
-            
-            # Try different date fields
-            date_fields = ['DateTimeOriginal', 'DateTime', 'CreateDate', 'DateTimeDigitized']
-            for field in date_fields:
-                if (field in exif_data and exif_data[field]):
-                    # Format usually like "2020:01:30 14:31:26"
-                    date_str = str(exif_data[field])
-                    try:
-                        return datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                    except ValueError:
-                        try:
-                            # Try another common format
-                            return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                        except ValueError:
-                            continue
-            return None
+            return self._cached_metadata("date", file_path, _read_exif_date)
         except Exception as e:
             self.log(f"Error reading EXIF data from {file_path}: {e}")
             return None
+    
+    def _cached_metadata(self, kind, file_path, reader, file_stat=None):
+        """Return reader(file_path), reusing the stored result while the file's mtime and size are unchanged"""
+        if file_stat is None:
+            file_stat = os.stat(file_path)
+        found, value = self._lookup_metadata(kind, file_path, file_stat)
+        if found:
+            return value
+        value = reader(file_path)
+        self._store_metadata(kind, file_path, file_stat, value)
+        return value
+    
+    def _lookup_metadata(self, kind, file_path, file_stat):
+        """Return (True, value) if the cache holds a result for this version of the file"""
+        entry = self._load_metadata_cache()[kind].get(file_path)
+        if entry is not None and entry[0] == (file_stat.st_mtime_ns, file_stat.st_size):
+            return True, entry[1]
+        return False, None
+    
+    def _store_metadata(self, kind, file_path, file_stat, value):
+        """Remember a result for this version of the file"""
+        self._load_metadata_cache()[kind][file_path] = ((file_stat.st_mtime_ns, file_stat.st_size), value)
+        self._metadata_cache_dirty = True
+    
+    def _load_metadata_cache(self):
+        """Load the EXIF date/GPS cache from disk on first use"""
+        if self._metadata_cache is None:
+            with self._metadata_cache_lock:
+                # Another thread may have loaded it while this one waited
+                if self._metadata_cache is None:
+                    cache = {"date": {}, "gps": {}}
+                    try:
+                        if os.path.exists(self.metadata_cache_file):
+                            with open(self.metadata_cache_file, 'r') as f:
+                                data = json.load(f)
+                            for path, (mtime_ns, size, value) in data.get("date", {}).items():
+                                value = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S") if value else None
+                                cache["date"][path] = ((mtime_ns, size), value)
+                            for path, (mtime_ns, size, value) in data.get("gps", {}).items():
+                                cache["gps"][path] = ((mtime_ns, size), value)
+                    except Exception as e:
+                        print(f"Error loading metadata cache: {e}")
+                    self._metadata_cache = cache
+        return self._metadata_cache
+    
+    def save_metadata_cache(self):
+        """Save the EXIF date/GPS cache if it changed, keeping the newest entries"""
+        if not self._metadata_cache_dirty:
+            return
+        try:
+            data = {}
+            for kind, cache in self._metadata_cache.items():
+                entries = list(cache.items())[-METADATA_CACHE_LIMIT:]
+                data[kind] = {
+                    path: [mtime_ns, size, value.isoformat() if kind == "date" and value else value]
+                    for path, ((mtime_ns, size), value) in entries
+                }
             
-    def get_gps_data(self, file_path):
-        """Extract GPS data from image/video EXIF metadata with extra safeguards against segfaults"""
-        if not HAS_PIL:
+            _write_json_atomic(self.metadata_cache_file, data)
+            self._metadata_cache_dirty = False
+        except Exception as e:
+            print(f"Error saving metadata cache: {e}")
+            
+    def get_gps_data(self, file_path, file_stat=None):
+        """Extract GPS data from image/video EXIF metadata with extra safeguards against segfaults
+        
+        file_stat can be passed when the caller already has the file's stat result.
+        """
+        if exifread is None and not self.has_pil():
             return None
             
         try:
-            # First check if file is accessible
-            if not os.path.isfile(file_path) or not os.access(file_path, os.R_OK):
+            # First check if file is accessible; unreadable files fail in Image.open below
+            try:
+                if file_stat is None:
+                    file_stat = os.stat(file_path)
+            except OSError:
+                file_stat = None
+            if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
                 self.log(f"File not accessible: {file_path}")
                 return None
             
             # Check file size - skip if too large (to avoid memory issues)
-            try:
-                file_size = os.path.getsize(file_path)
-                if file_size > 50 * 1024 * 1024:  # Skip files larger than 50MB
-                    self.log(f"Skipping large file ({file_size/1024/1024:.1f} MB): {os.path.basename(file_path)}")
-                    return None
-            except Exception:
-                pass
+            file_size = file_stat.st_size
+            if file_size > 50 * 1024 * 1024:  # Skip files larger than 50MB
+                self.log(f"Skipping large file ({file_size/1024/1024:.1f} MB): {os.path.basename(file_path)}")
+                return None
                 
             # Only process known image formats that commonly have GPS data
             if not file_path.lower().endswith(('.jpg', '.jpeg')):
                 return None
                 
             # Extract GPS data in a way that avoids PIL segfaulting at shutdown
-            return self._extract_gps_with_exception_trap(file_path)
+            return self._cached_metadata("gps", file_path, self._read_gps, file_stat)
                 
         except Exception as e:
             self.log(f"Error reading EXIF data from {file_path}: {e}")
             return None
 
+    def _read_gps(self, file_path):
+        """Read GPS coordinates, using exifread when installed and Pillow otherwise"""
+        if exifread is not None:
+            try:
+                return self._read_gps_fast(file_path)
+            except Exception:
+                pass  # Unusual EXIF layout - let Pillow have a go
+        if not self.has_pil():
+            return None
+        return self._extract_gps_with_exception_trap(file_path)
+    
+    def _read_gps_fast(self, file_path):
+        """Read GPS coordinates with exifread, which parses only the EXIF segment
+        
+        Returns None when the file has no GPS position; raises ValueError when the
+        tags are present but can't be converted.
+        """
+        with open(file_path, 'rb') as f:
+            # GPS IFD tags come in id order, so the refs are read before longitude
+            tags = exifread.process_file(f, details=False, stop_tag='GPS GPSLongitude')
+        lat_tag = tags.get('GPS GPSLatitude')
+        lon_tag = tags.get('GPS GPSLongitude')
+        if not lat_tag or not lon_tag:
+            return None
+        
+        lat = self._convert_gps_coords(lat_tag.values)
+        lon = self._convert_gps_coords(lon_tag.values)
+        if lat is None or lon is None:
+            raise ValueError("unreadable GPS coordinates")
+        
+        # Apply reference direction
+        if str(tags.get('GPS GPSLatitudeRef', 'N')) == 'S':
+            lat = -lat
+        if str(tags.get('GPS GPSLongitudeRef', 'E')) == 'W':
+            lon = -lon
+        
+        # Validate coordinates
+        if abs(lat) > 90 or abs(lon) > 180:
+            return None
+        return {'latitude': lat, 'longitude': lon}
+
     def _extract_gps_with_exception_trap(self, file_path):
         """Extract GPS data with added protection to prevent segfaults"""
         # Use a try-except block with minimal PIL operations
         try:
-            # Do minimal work with the PIL Image object
-            with open(file_path, 'rb') as f:
-                # Just read a small chunk to verify the file is readable
-                f.read(16)
-                
             # Extract by hand to avoid PIL segfaults at shutdown    
             from PIL.ExifTags import GPSTAGS
             
-            # Use a safer approach that minimizes image loading
+            # Image.open only reads the headers, so this doesn't decode pixel data
             with Image.open(file_path) as image:
-                # Check if image has EXIF data
-                if not hasattr(image, '_getexif') or image._getexif() is None:
-                    return None
-                
-                # Get a copy of EXIF data
+                # Get a copy of EXIF data, parsed once
                 try:
-                    exif_dict = {}
-                    exif_data = image._getexif()
+                    exif_data = image._getexif() if hasattr(image, '_getexif') else None
                     
                     # More robust check for exif_data - must be None check AND type check
-                    if exif_data is None or not hasattr(exif_data, 'items'):
+                    if exif_data is None or not hasattr(exif_data, 'get'):
                         return None
                         
-                    # Find GPS info tag - with additional try/except for safety
-                    gps_info = None
-                    try:
-                        for tag, value in exif_data.items():
-                            tag_name = TAGS.get(tag, str(tag))
-                            exif_dict[tag_name] = value
-                            if tag_name == 'GPSInfo':
-                                gps_info = value
-                                break
-                    except Exception as e:
-                        self.log(f"Error iterating EXIF data: {str(e)}")
-                        return None
+                    # Look the GPS info tag up directly
+                    gps_info = exif_data.get(EXIF_GPSINFO_TAG)
                     
                     # We no longer need the full EXIF data
-                    exif_dict.clear()
                     exif_data = None
                     
                     if not gps_info:
@@ -2105,31 +3017,51 @@ Troubleshooting:
             return
 
         self.log(f"Starting organization of {len(self.preview)} files")
+        self._invalidate_scan_cache()
         success_count = 0
         skipped_count = 0
+        # Create each destination directory once instead of once per file
+        created_dirs = []
+        for dst_dir in {os.path.dirname(dst) for _, dst in self.preview}:
+            try:
+                if not os.path.isdir(dst_dir):
+                    os.makedirs(dst_dir, exist_ok=True)
+                    created_dirs.append(dst_dir)
+            except OSError as e:
+                self.log(f"ERROR: Could not create {dst_dir}: {e}")
+        if created_dirs and self.preview_mode:
+            self._remember_organized_folders(self.preview_mode, created_dirs)
+        # Names taken per destination directory, listed once and extended as files move in
+        existing_names = {}
         for src, dst in self.preview:
             try:
                 # Skip if source and destination directories are the same
-                if os.path.dirname(src) == os.path.dirname(dst):
+                dst_dir = os.path.dirname(dst)
+                if os.path.dirname(src) == dst_dir:
                     skip_message = f"Skipped {os.path.basename(src)} - already in correct location"
                     self.status_label.config(text=skip_message)
                     self.log(skip_message)
                     skipped_count += 1
                     continue
                 
-                # Create destination directory if it doesn't exist
-                dst_dir = os.path.dirname(dst)
-                os.makedirs(dst_dir, exist_ok=True)
-                
                 # Get unique filename if needed
                 dst_filename = os.path.basename(dst)
-                if os.path.exists(dst):
-                    dst_filename = self.generate_unique_filename(dst_dir, dst_filename)
-                    self.log(f"Renamed {os.path.basename(dst)} to {dst_filename} to avoid conflict")
+                if dst_dir not in existing_names:
+                    existing_names[dst_dir] = self._list_existing_names(dst_dir)
+                dst_filename = self.generate_unique_filename(dst_dir, dst_filename,
+                                                             existing_names[dst_dir])
                 
-                # Move the file
-                final_dst = os.path.join(dst_dir, dst_filename)
-                shutil.move(src, final_dst)
+                # Move the file, taking the next free name if one appeared since the listing
+                while True:
+                    final_dst = os.path.join(dst_dir, dst_filename)
+                    try:
+                        self._move_file(src, final_dst)
+                        break
+                    except FileExistsError:
+                        dst_filename = self.generate_unique_filename(dst_dir, os.path.basename(dst),
+                                                                     existing_names[dst_dir])
+                if dst_filename != os.path.basename(dst):
+                    self.log(f"Renamed {os.path.basename(dst)} to {dst_filename} to avoid conflict")
                 self.log(f"Moved: {src} -> {final_dst}")
                 success_count += 1
             except Exception as e:
@@ -2150,21 +3082,17 @@ Troubleshooting:
         self.status_label.config(text=message)
         self.log(message)
 
-    def get_file_category(self, file_path):
-        """Determine the category of a file based on its extension"""
-        _, extension = os.path.splitext(file_path)
-        extension = extension.lower()  # Normalize extension to lowercase
-        
-        for category, extensions in self.category_definitions.items():
-            if extension in extensions:
-                return category
-        
-        # If we don't recognize the extension, return "Other"            
-        return "Other"
+    def get_file_category(self, filename):
+        """Determine the category of a file (by name) based on its extension"""
+        # If we don't recognize the extension, return "Other"
+        return self._ext_to_category.get(_file_extension(filename).lower(), "Other")
     
     def show_date_help(self):
         """Show help information about date sources"""
+        if self._show_cached_help("date"):
+            return
         help_window = Toplevel(self.root)
+        self._cache_help_window("date", help_window)
         help_window.title("Date Source Help")
         help_window.geometry("500x400")
         
@@ -2220,7 +3148,7 @@ the file's creation date.
         text.config(state="disabled")
         
         # Add close button
-        close_button = tk.Button(help_window, text="Close", command=help_window.destroy)
+        close_button = tk.Button(help_window, text="Close", command=help_window.withdraw)
         close_button.pack(pady=10)
 
     def confirm_delete_empty(self):
@@ -2242,34 +3170,31 @@ the file's creation date.
         # Save the config when this option changes    
         self.save_config()
     
-    def is_dir_empty(self, path):
-        """Check if a directory is empty."""
-        try:
-            # Check if directory contains any files or subdirectories
-            with os.scandir(path) as entries:
-                return next(entries, None) is None
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            # If there's an error accessing the directory, consider it non-empty for safety
-            return False
-            
-    def remove_empty_dirs(self, path):
-        """Recursively remove empty directories starting from path."""
-        if not os.path.isdir(path):
-            return
-            
-        # Process all subdirectories first
-        for item in os.listdir(path):
-            subdir = os.path.join(path, item)
-            if os.path.isdir(subdir):
-                self.remove_empty_dirs(subdir)
-                
-        # Check if current directory is empty now
-        if self.is_dir_empty(path) and path != self.path.get():  # Don't delete the root folder
+    def remove_empty_dirs(self, path, root_path=None):
+        """Remove empty directories under path, deepest first, without recursion.
+        
+        os.walk lists each directory once, children before parents; a directory is
+        removed when it has no files and all its subdirectories were removed before it.
+        Returns True if path itself was removed.
+        """
+        if root_path is None:
+            root_path = self.path.get()
+        
+        removed = set()
+        for dirpath, dirnames, filenames in os.walk(path, topdown=False):
+            if filenames or dirpath == root_path:  # Don't delete the root folder
+                continue
+            # Unreadable or symlinked subdirectories are never in removed, which
+            # keeps their parent for safety
+            if any(os.path.join(dirpath, name) not in removed for name in dirnames):
+                continue
             try:
-                os.rmdir(path)
-                self.log(f"Removed empty directory: {path}")
+                os.rmdir(dirpath)
+                removed.add(dirpath)
+                self.log(f"Removed empty directory: {dirpath}")
             except Exception as e:
-                self.log(f"Error removing directory {path}: {e}")
+                self.log(f"Error removing directory {dirpath}: {e}")
+        return path in removed
 
     def preview_by_location(self):
         """Preview organizing files by their geographic location metadata"""
@@ -2292,24 +3217,56 @@ the file's creation date.
             if messagebox.askyesno("Missing Dependency", 
                                   "The 'requests' library is required for location-based organization.\n\n"
                                   "Would you like to install it now?"):
-                try:
-                    import sys
-                    import subprocess
-                    subprocess.check_call([sys.executable, "-m", "pip", "install", "requests"])
-                    import requests
-                    self.log("Requests library installed successfully.")
-                except Exception as e:
-                    self.log(f"Error installing requests: {e}")
-                    messagebox.showerror("Installation Failed", 
-                                       f"Could not install the requests library: {e}\n\n"
-                                       "Please install it manually with: pip install requests")
-                    return
+                # Carry on once pip is done, without blocking the UI meanwhile
+                self._install_requests_async(
+                    lambda success: success and self._start_location_preview(folder))
             else:
                 self.log("Location-based organization cancelled - missing requests library")
-                return
-                
-        # Also verify PIL is installed
-        if not HAS_PIL:
+            return
+        
+        self._start_location_preview(folder)
+    
+    def _install_requests_async(self, on_done):
+        """Install requests with pip in a background thread, streaming its output to the log
+        
+        on_done(success) is called on the main thread when pip has finished.
+        """
+        self.log("Installing requests library...")
+        self.status_label.config(text="Installing requests library...")
+        
+        def finish(success, error):
+            if success:
+                importlib.invalidate_caches()  # Make the new package importable
+                self.log("Requests library installed successfully.")
+            else:
+                self.log(f"Error installing requests: {error}")
+                messagebox.showerror("Installation Failed", 
+                                   f"Could not install the requests library: {error}\n\n"
+                                   "Please install it manually with: pip install requests")
+            self.status_label.config(text="Ready")
+            on_done(success)
+        
+        def run():
+            try:
+                process = subprocess.Popen(
+                    [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "requests"],
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+                for line in process.stdout:
+                    if line.strip():
+                        self.log(line.rstrip())
+                success = process.wait() == 0
+                error = f"pip exited with code {process.returncode}"
+            except Exception as e:
+                success = False
+                error = str(e)
+            self.root.after(0, finish, success, error)
+        
+        threading.Thread(target=run, daemon=True).start()
+    
+    def _start_location_preview(self, folder):
+        """Open the progress dialog and start reading locations for preview_by_location"""
+        # Also verify PIL (or exifread) is installed
+        if exifread is None and not self.has_pil():
             messagebox.showwarning("Missing Dependency", 
                                   "Pillow (PIL) is not installed. Location data extraction will not work.\n\n"
                                   "Please install it with: pip install pillow")
@@ -2371,38 +3328,19 @@ the file's creation date.
                                     detail_label, status_detail, processing_cancelled):
         """Process files for location with explicit cleanup to prevent segfaults"""
         try:
-            # Initialize locals to None to ensure proper cleanup
-            preview = None
-            location_counts = None
-            files = None
-            image_files = None
-            
             # Call the actual processing function with more defensive programming
             self._process_location_files(folder, loading, progress, status_label,
                                       detail_label, status_detail, processing_cancelled)
         except Exception as e:
             self.log(f"Critical error in location processing: {str(e)}")
-            import traceback
             self.log(f"Error details: {traceback.format_exc()}")
             self.root.after(0, lambda: self.safe_destroy_window(loading))
             self.root.after(0, lambda: messagebox.showerror("Error", 
                                                           f"An error occurred while processing location data:\n\n{str(e)}"))
         finally:
-            # Force garbage collection multiple times to ensure cleanup
-            import gc
-            gc.collect()
-            gc.collect()
-            
             # Remove any reference to the thread
             if hasattr(self, 'location_thread'):
                 self.location_thread = None
-            
-            # Explicitly nullify variables that might have PIL references
-            preview = None
-            location_counts = None
-            files = None
-            image_files = None
-            gc.collect()
 
     def safe_destroy_window(self, window):
         """Safely destroy a window if it exists and hasn't been destroyed"""
@@ -2416,17 +3354,48 @@ the file's creation date.
                              detail_label, status_detail, processing_cancelled):
         """Process files for location-based organization with additional safety"""
         preview = []
-        location_counts = {}  # Track which locations have files
+        location_counts = defaultdict(int)  # Track which locations have files
         files_with_location = 0
         files_without_location = 0
         error_count = 0  # Track errors for reporting
         
+        # Latest dialog state, written by this worker and applied by apply_ui on the
+        # main thread about 30 times a second, however fast files are processed
+        ui_lock = threading.Lock()
+        ui_state = {}
+        ui_running = [True]
+        
+        def set_ui(**values):
+            with ui_lock:
+                ui_state.update(values)
+        
+        def apply_ui():
+            with ui_lock:
+                values = dict(ui_state)
+                ui_state.clear()
+            try:
+                if "status" in values:
+                    status_label.config(text=values["status"])
+                if "detail" in values:
+                    detail_label.config(text=values["detail"])
+                if "current" in values:
+                    status_detail.config(text=values["current"])
+                if "maximum" in values:
+                    progress.config(maximum=values["maximum"])
+                if "value" in values:
+                    progress.config(value=values["value"])
+            except tk.TclError:
+                return  # Dialog already closed
+            if ui_running[0]:
+                self.root.after(33, apply_ui)
+        
+        self.root.after(0, apply_ui)
+        
         # Get all files first
         try:
-            files = self.get_files(folder)
-            # Create a copy of filtered files and clear original to reduce memory pressure
-            image_files = [f for f in files if f.lower().endswith(('.jpg', '.jpeg'))]
-            files = None  # Allow garbage collection of original list
+            # Keep the scandir entries so each file's stat is taken at most once
+            image_files = [entry for entry in self.get_file_entries(folder)
+                           if entry.name.lower().endswith(('.jpg', '.jpeg'))]
             
             if not image_files:
                 self.log("No image files found in selected folder")
@@ -2439,88 +3408,112 @@ the file's creation date.
             total_files = len(image_files)
             
             # Update progress settings
-            self.root.after(0, lambda: progress.config(maximum=total_files))
-            
-            # Process in smaller batches to prevent memory issues
-            batch_size = 5  # Reduced batch size
-            for batch_start in range(0, total_files, batch_size):
-                # Check if processing was cancelled
-                if processing_cancelled[0]:
-                    self.log("Location processing cancelled by user")
-                    return
+            set_ui(maximum=total_files)
+            
+            # Destination folders shared by every file
+            locations_root = os.path.join(folder, "Locations")
+            unknown_folder = os.path.join(locations_root, "Unknown Location")
+            
+            # Pass 1: read GPS data, grouping located files by rounded coordinates
+            # (4 decimals, about 11 m) so each place is looked up only once
+            buckets = defaultdict(list)
+            
+            def read_gps(entry):
+                """Return (entry, gps data, error, skipped); runs in the worker threads"""
+                try:
+                    # Skip files that are too large (>30MB)
+                    try:
+                        file_stat = entry.stat()
+                    except OSError:
+                        file_stat = None
+                    if file_stat and file_stat.st_size > 30 * 1024 * 1024:
+                        self.log(f"Skipping large file: {entry.name}")
+                        return entry, None, None, True
+                    return entry, self.get_gps_data(entry.path, file_stat), None, False
+                except Exception as e:
+                    return entry, None, e, False
+            
+            # Reading EXIF is disk bound, so overlap files across a thread pool
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 2)) as executor:
+                futures = [executor.submit(read_gps, entry) for entry in image_files]
+                for current_index, future in enumerate(futures):
+                    # Check if processing was cancelled
+                    if processing_cancelled[0]:
+                        for pending in futures:
+                            pending.cancel()
+                        self.log("Location processing cancelled by user")
+                        return
                     
-                batch_end = min(batch_start + batch_size, total_files)    
-                batch = image_files[batch_start:batch_end]
-                
-                # Process each file in the batch
-                for i, file_path in enumerate(batch):
-                    # Force garbage collection every 20 files
-                    if (batch_start + i) % 20 == 0:
-                        import gc
-                        gc.collect()
-                        
-                    current_index = batch_start + i    
-                    file_basename = os.path.basename(file_path)
+                    entry, gps_data, error, skipped = future.result()
                     
-                    # Update progress more frequently
+                    file_path = entry.path
+                    file_basename = entry.name
+                    
+                    # Update progress
                     progress_pct = int((current_index / total_files) * 100)
-                    self.root.after(0, lambda idx=current_index, tot=total_files, pct=progress_pct, found=files_with_location, name=file_basename: (
-                        status_label.config(text=f"Processing files... ({idx+1}/{tot})"),
-                        detail_label.config(text=f"{pct}% complete - {found} photos with GPS data found"),
-                        status_detail.config(text=f"Current file: {name}"),
-                        progress.config(value=idx+1)
-                    ))
+                    set_ui(status=f"Processing files... ({current_index+1}/{total_files})",
+                           detail=f"{progress_pct}% complete - {files_with_location} photos with GPS data found",
+                           current=f"Current file: {file_basename}",
+                           value=current_index+1)
+                    
+                    if skipped:
+                        continue
+                    if error is not None:
+                        error_count += 1
+                        self.log(f"Error processing {file_basename}: {str(error)}")
+                    elif gps_data and (gps_data['latitude'] != 0 or gps_data['longitude'] != 0):
+                        bucket = (round(gps_data['latitude'], 4), round(gps_data['longitude'], 4))
+                        buckets[bucket].append((file_path, file_basename))
+                        files_with_location += 1
+                    else:
+                        # For files without location data
+                        dest_path = os.path.join(unknown_folder, file_basename)
+                        preview.append((file_path, dest_path))
+                        files_without_location += 1
+            
+            # Pass 2: look up each place once and map its files to the location folder.
+            # Lookups overlap their network latency; get_location_name keeps the
+            # combined request rate within Nominatim's limit
+            granularity = self.location_granularity.get()
+            total_buckets = len(buckets)
+            set_ui(maximum=max(total_buckets, 1), value=0)
+            with ThreadPoolExecutor(max_workers=GEOCODE_WORKERS) as executor:
+                futures = {
+                    executor.submit(self.get_location_name, {'latitude': lat, 'longitude': lon}, granularity): (lat, lon)
+                    for lat, lon in buckets
+                }
+                for index, future in enumerate(as_completed(futures)):
+                    # Check if processing was cancelled
+                    if processing_cancelled[0]:
+                        for pending in futures:
+                            pending.cancel()
+                        self.log("Location processing cancelled by user")
+                        return
                     
-                    # Extract GPS data
+                    lat, lon = futures[future]
+                    bucket_files = buckets[(lat, lon)]
+                    set_ui(status=f"Looking up locations... ({index+1}/{total_buckets})",
+                           detail=f"{files_with_location} photos with GPS data found",
+                           current=f"{len(bucket_files)} photos at this place",
+                           value=index+1)
+                    
+                    # Get location name (with Berber characters filtered)
                     try:
-                        # Skip files that are too large (>30MB)
-                        try:
-                            if os.path.getsize(file_path) > 30 * 1024 * 1024:
-                                self.log(f"Skipping large file: {file_basename}")
-                                continue
-                        except:
-                            pass
-                        
-                        gps_data = self.get_gps_data(file_path)
-                        
-                        # Add very small sleep to prevent UI lockups
-                        time.sleep(0.01)
-                        
-                        if gps_data and (gps_data['latitude'] != 0 or gps_data['longitude'] != 0):
-                            # Get location name (with Berber characters filtered)
-                            try:
-                                location_name = self.get_location_name(gps_data, self.location_granularity.get())
-                            except Exception as e:
-                                self.log(f"Error getting location name: {e}")
-                                location_name = f"GPS({gps_data['latitude']:.4f},{gps_data['longitude']:.4f})"
-                            
-                            # Create safe folder name
-                            safe_location = re.sub(r'[<>:"/\\|?*]', '_', location_name)
-                            
-                            # Prepare destination path
-                            location_folder = os.path.join(folder, "Locations", safe_location)
-                            dest_path = os.path.join(location_folder, file_basename)
-                            
-                            # Add to preview
-                            preview.append((file_path, dest_path))
-                            
-                            # Track location
-                            if safe_location not in location_counts:
-                                location_counts[safe_location] = 0
-                            location_counts[safe_location] += 1
-                            files_with_location += 1
-                        else:
-                            # For files without location data
-                            unknown_folder = os.path.join(folder, "Locations", "Unknown Location")
-                            dest_path = os.path.join(unknown_folder, file_basename)
-                            preview.append((file_path, dest_path))
-                            files_without_location += 1
+                        location_name = future.result()
                     except Exception as e:
-                        error_count += 1
-                        self.log(f"Error processing {file_basename}: {str(e)}")
-                
-                # Sleep briefly between batches to allow UI updates    
-                time.sleep(0.1)
+                        self.log(f"Error getting location name: {e}")
+                        location_name = f"GPS({lat:.4f},{lon:.4f})"
+                    
+                    # Create safe folder name
+                    safe_location = self._ILLEGAL_PATH_CHARS.sub('_', location_name)
+                    location_folder = os.path.join(locations_root, safe_location)
+                    
+                    # Add every file at this place to the preview in one extend
+                    preview.extend((file_path, os.path.join(location_folder, file_basename))
+                                   for file_path, file_basename in bucket_files)
+                    
+                    # Track location
+                    location_counts[safe_location] += len(bucket_files)
             
             # Show results
             self.root.after(0, lambda: self.safe_destroy_window(loading))
@@ -2539,21 +3532,18 @@ the file's creation date.
                 self.log(f"  {location}: {count} files")
             
             # Save preview and show on UI thread
-            self.root.after(0, lambda p=list(preview): self.show_preview(p))
+            self.root.after(0, self.show_preview, preview)
             self.log(f"Preview ready: {len(preview)} files to organize by location")
             
-            # Allow garbage collection
-            preview.clear()
-            location_counts.clear()
-            image_files.clear()
-            
         except Exception as e:
             self.log(f"Error in location processing: {str(e)}")
-            import traceback
             self.log(traceback.format_exc())
             self.root.after(0, lambda: self.safe_destroy_window(loading))
             self.root.after(0, lambda: messagebox.showerror("Error", 
                                                          f"An error occurred while processing files:\n\n{str(e)}"))
+        finally:
+            # Let the last scheduled apply_ui be the final one
+            ui_running[0] = False
 
     def configure_location_settings(self):
         """Configure settings for location-based organization"""
@@ -2643,66 +3633,49 @@ the file's creation date.
         """Get location name from GPS coordinates using reverse geocoding"""
         if not gps_data or gps_data['latitude'] == 0 and gps_data['longitude'] == 0:
             return "Unknown Location"
+        lat = gps_data['latitude']
+        lon = gps_data['longitude']
+        
+        # Exact coordinates (or an unknown granularity) don't need a lookup at all
+        read_name = GEOCODE_NAME_READERS.get(granularity)
+        if read_name is None:
+            return f"GPS({lat:.4f},{lon:.4f})"
+        
+        # Nearby photos (about 11 m at 4 decimals) share a lookup
+        cache_key = f"{round(lat, 4)}|{round(lon, 4)}|{granularity}"
+        cached = self._load_geocode_cache().get(cache_key)
+        if cached is not None and time.time() - cached[1] < GEOCODE_CACHE_TTL:
+            return cached[0]
+        
         try:
-            import requests
-            lat = gps_data['latitude']
-            lon = gps_data['longitude']
+            session = self._get_geocode_session()
             
             # Log geocoding request
             self.log(f"Requesting location info for coordinates: ({lat:.6f}, {lon:.6f})")
             
             # Use Nominatim for reverse geocoding (no API key required)
             # Using zoom parameter to control detail level
-            zoom_level = {"country": 3, "city": 10, "exact": 18}.get(granularity, 10)
+            zoom_level = GEOCODE_ZOOM_LEVELS[granularity]
             url = f"https://nominatim.openstreetmap.org/reverse?format=json&lat={lat}&lon={lon}&zoom={zoom_level}"
-            headers = {"User-Agent": "FileOrganizer/1.0"}
-            response = requests.get(url, headers=headers)
+            response = self._geocode_request(session, url)
             if response.status_code != 200:
                 self.log(f"Geocoding API error {response.status_code}: {response.text}")
                 return f"GPS({lat:.4f},{lon:.4f})"
-            data = response.json()
+            data = _json_loads(response.content)
             
-            # Extract location based on granularity
-            location_name = ""
-            if granularity == "country":
-                if "address" in data and "country" in data["address"]:
-                    location_name = data["address"]["country"]
-                else:
-                    location_name = "Unknown Country"
-            elif granularity == "city":
-                address = data.get("address", {})
-                # Try different fields for city/region name in priority order
-                for field in ["city", "town", "village", "county", "state", "country"]:
-                    if field in address:
-                        if field != "country" and "country" in address:
-                            location_name = f"{address[field]}, {address['country']}"
-                            break
-                        location_name = address[field]
-                        break
-                
-                # Fallback to display_name which contains the complete address
-                if not location_name and "display_name" in data:
-                    # Take just the first part of the display name to keep it shorter
-                    parts = data["display_name"].split(",")
-                    if len(parts) > 2:
-                        location_name = f"{parts[0].strip()}, {parts[-1].strip()}"
-                    else:
-                        location_name = data["display_name"]
-                
-                # Last resort - use coordinates
-                if not location_name:
-                    location_name = f"GPS({lat:.4f},{lon:.4f})"
-            else:  # exact - use precise coordinates
-                location_name = f"GPS({lat:.4f},{lon:.4f})"
+            # Extract location based on granularity, using coordinates as a last resort
+            location_name = read_name(data) or f"GPS({lat:.4f},{lon:.4f})"
             
             # Filter out non-Latin characters (including Berber) to prevent encoding issues
             # This keeps only ASCII and common Latin characters
-            filtered_name = ''.join(c for c in location_name if ord(c) < 128)
+            filtered_name = location_name.encode('ascii', 'ignore').decode('ascii')
             
             # If filtering removed all characters, use GPS coordinates
             if not filtered_name or filtered_name.isspace():
                 filtered_name = f"GPS({lat:.4f},{lon:.4f})"
             self.log(f"Location: {filtered_name}")
+            self._geocode_cache[cache_key] = (filtered_name, time.time())
+            self._geocode_cache_dirty = True
             return filtered_name
                 
         except ImportError:
@@ -2710,12 +3683,195 @@ the file's creation date.
             return f"GPS({gps_data['latitude']:.4f},{gps_data['longitude']:.4f})"
         except Exception as e:
             self.log(f"Error getting location name: {e}")
-            lat = gps_data['latitude']
-            lon = gps_data['longitude']
             return f"GPS({lat:.4f},{lon:.4f})"
+    
+    def _get_geocode_session(self):
+        """Return the shared HTTP session for geocoding, creating it on first use
+        
+        Keeps the connection to Nominatim alive between lookups; retries are made by
+        _geocode_request so they respect the rate limit. Raises ImportError if requests
+        isn't installed.
+        """
+        with self._geocode_rate_lock:
+            if self._geocode_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                
+                session = requests.Session()
+                session.headers.update({"User-Agent": "FileOrganizer/1.0"})
+                session.mount("https://", HTTPAdapter(pool_maxsize=GEOCODE_WORKERS * 2))
+                self._geocode_session = session
+            return self._geocode_session
+    
+    def _geocode_request(self, session, url):
+        """GET url from the geocoding service, retrying transient failures
+        
+        Every attempt waits for a rate limit slot; a Retry-After from the server
+        (or a growing delay) is honoured before retrying.
+        """
+        for attempt in range(GEOCODE_RETRIES + 1):
+            self._wait_for_geocode_slot()
+            try:
+                response = session.get(url, timeout=(5, 15))
+            except OSError:
+                # requests' connection errors and timeouts
+                if attempt == GEOCODE_RETRIES:
+                    raise
+                time.sleep(GEOCODE_MIN_INTERVAL * 2 ** attempt)
+                continue
+            if response.status_code not in GEOCODE_RETRY_STATUSES or attempt == GEOCODE_RETRIES:
+                return response
+            retry_after = response.headers.get("Retry-After", "")
+            time.sleep(int(retry_after) if retry_after.isdigit() else GEOCODE_MIN_INTERVAL * 2 ** attempt)
+    
+    def _wait_for_geocode_slot(self):
+        """Block until another geocoding request is allowed (shared by all lookup threads)"""
+        with self._geocode_rate_lock:
+            now = time.monotonic()
+            wait = self._next_geocode_at - now
+            self._next_geocode_at = max(now, self._next_geocode_at) + GEOCODE_MIN_INTERVAL
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _load_geocode_cache(self):
+        """Load the reverse geocoding cache from disk on first use, dropping expired entries"""
+        if self._geocode_cache is None:
+            with self._geocode_cache_lock:
+                # Another thread may have loaded it while this one waited
+                if self._geocode_cache is None:
+                    cache = {}
+                    try:
+                        if os.path.exists(self.geocode_cache_file):
+                            with open(self.geocode_cache_file, 'r') as f:
+                                data = json.load(f)
+                            now = time.time()
+                            for key, (name, timestamp) in data.items():
+                                if now - timestamp < GEOCODE_CACHE_TTL:
+                                    cache[key] = (name, timestamp)
+                    except Exception as e:
+                        print(f"Error loading geocode cache: {e}")
+                    self._geocode_cache = cache
+        return self._geocode_cache
+    
+    def save_geocode_cache(self):
+        """Save the reverse geocoding cache if it changed"""
+        if not self._geocode_cache_dirty:
+            return
+        try:
+            _write_json_atomic(self.geocode_cache_file,
+                               {key: list(entry) for key, entry in self._geocode_cache.items()})
+            self._geocode_cache_dirty = False
+        except Exception as e:
+            print(f"Error saving geocode cache: {e}")
+
+    def _read_exif_dates(self, files):
+        """Read EXIF dates for candidate images using a thread pool
+        
+        Returns a dict mapping file path to EXIF date (or None). Files whose date
+        will come from the filename are skipped, as are non-image files.
+        """
+        date_source = self.date_source.get()
+        if date_source not in ("exif", "all") or not self.has_pil():
+            return {}
+        
+        candidates = [
+            f for f in files
+            if f.lower().endswith(EXIF_DATE_EXTENSIONS)
+            and (date_source == "exif" or not self.get_date_from_filename(os.path.basename(f)))
+        ]
+        if not candidates:
+            return {}
+        
+        total = len(candidates)
+        self.update_processing_dialog(f"Reading EXIF data from {total} images...", 0, total)
+        
+        exif_dates = {}
+        self._load_metadata_cache()  # Load once here rather than racing in the workers
+        
+        # Large batches are parsed in worker processes, since Pillow's EXIF
+        # parsing is pure Python and threads would contend for the GIL (Python 3.7+,
+        # which can start the workers without forking)
+        if total >= EXIF_PROCESS_POOL_MIN and (os.cpu_count() or 1) > 1 and sys.version_info >= (3, 7):
+            try:
+                return self._read_exif_dates_in_processes(candidates)
+            except (OSError, BrokenProcessPool) as e:
+                self.log(f"Could not use worker processes for EXIF data, using threads: {e}")
+        
+        # Image reads are I/O bound, so threads overlap disk/network latency
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            futures = {executor.submit(self.get_date_from_exif, f): f for f in candidates}
+            for done, future in enumerate(as_completed(futures), 1):
+                exif_dates[futures[future]] = future.result()
+                
+                if done % 10 == 0:
+                    self.update_processing_dialog(f"Reading EXIF data... ({done}/{total})", done, total)
+                
+                # Check for cancel
+                if self.cancel_scan:
+                    for pending in futures:
+                        pending.cancel()
+                    raise InterruptedError("File scanning was cancelled")
+        return exif_dates
+
+    def _read_exif_dates_in_processes(self, candidates):
+        """Read EXIF dates in a process pool, reusing cached results; same return as _read_exif_dates"""
+        total = len(candidates)
+        exif_dates = {}
+        stats = {}
+        to_read = []
+        for file_path in candidates:
+            try:
+                file_stat = os.stat(file_path)
+            except OSError as e:
+                self.log(f"Error reading EXIF data from {file_path}: {e}")
+                exif_dates[file_path] = None
+                continue
+            found, value = self._lookup_metadata("date", file_path, file_stat)
+            if found:
+                exif_dates[file_path] = value
+            else:
+                stats[file_path] = file_stat
+                to_read.append(file_path)
+        
+        workers = os.cpu_count() or 1
+        # Enough chunks to keep every process busy, few enough to keep overhead low
+        chunk_size = max(50, min(500, len(to_read) // (workers * 4) or 1))
+        chunks = [to_read[i:i + chunk_size] for i in range(0, len(to_read), chunk_size)]
+        
+        # Spawn rather than fork the workers - forking this process, with Tk and other
+        # threads running, can leave a child stuck on a lock another thread held
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        cancelled = False
+        try:
+            futures = [executor.submit(_read_exif_date_batch, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for file_path, value, error in future.result():
+                    if error is not None:
+                        self.log(f"Error reading EXIF data from {file_path}: {error}")
+                    else:
+                        self._store_metadata("date", file_path, stats[file_path], value)
+                    exif_dates[file_path] = value
+                
+                done = len(exif_dates)
+                self.update_processing_dialog(f"Reading EXIF data... ({done}/{total})", done, total)
+                
+                # Check for cancel
+                if self.cancel_scan:
+                    cancelled = True
+                    for pending in futures:
+                        pending.cancel()
+                    raise InterruptedError("File scanning was cancelled")
+        finally:
+            # Don't wait for chunks already running when cancelled
+            executor.shutdown(wait=not cancelled)
+        return exif_dates
 
-    def get_file_date(self, file_path):
-        """Get the best date for a file based on selected date source"""
+    def get_file_date(self, file_path, exif_dates=None, entry=None):
+        """Get the best date for a file based on selected date source
+        
+        exif_dates optionally holds EXIF dates already read by _read_exif_dates, and
+        entry the file's os.DirEntry, whose stat is reused for the file date.
+        """
         basename = os.path.basename(file_path)
         date_source = self.date_source.get()
         
@@ -2728,32 +3884,38 @@ the file's creation date.
         
         # Use EXIF data if selected or using all sources
         if date_source in ["exif", "all"]:
-            date_from_exif = self.get_date_from_exif(file_path)
+            if exif_dates is not None and file_path in exif_dates:
+                date_from_exif = exif_dates[file_path]
+            else:
+                date_from_exif = self.get_date_from_exif(file_path)
             if date_from_exif:
                 self.log(f"Using date from EXIF data for {basename}: {date_from_exif.strftime('%Y-%m-%d')}")
                 return date_from_exif
         
         # Use file creation time
-        date_from_file = self.get_file_creation_date(file_path)
+        file_stat = entry.stat(follow_symlinks=False) if entry is not None else None
+        date_from_file = self.get_file_creation_date(file_path, file_stat)
         self.log(f"Using creation date for {basename}: {date_from_file.strftime('%Y-%m-%d')}")
         return date_from_file
 
-    def get_file_creation_date(self, file_path):
-        """Get file creation date across different platforms"""
+    def get_file_creation_date(self, file_path, file_stat=None):
+        """Get file creation date across different platforms
+        
+        file_stat is the file's stat result if the caller already has it.
+        """
         try:
+            if file_stat is None:
+                file_stat = os.stat(file_path)
             # For Windows
             if platform.system() == 'Windows':
-                return datetime.fromtimestamp(os.path.getctime(file_path))
+                return datetime.fromtimestamp(file_stat.st_ctime)
             # For macOS
             elif platform.system() == 'Darwin':
-                stat = os.stat(file_path)
-                return datetime.fromtimestamp(stat.st_birthtime)
+                return datetime.fromtimestamp(file_stat.st_birthtime)
             # For Linux (note: Linux doesn't store creation time, so we use a workaround)
             else:
                 # Use the earliest time between modification and access time as best approximation
-                path = Path(file_path)
-                stat = path.stat()
-                return datetime.fromtimestamp(min(stat.st_mtime, stat.st_atime))
+                return datetime.fromtimestamp(min(file_stat.st_mtime, file_stat.st_atime))
         except Exception as e:
             self.log(f"Error getting creation date for {file_path}: {e}")
             # Fall back to modification time if there's an error
@@ -2761,7 +3923,10 @@ the file's creation date.
 
     def show_location_help(self):
         """Show help information about location-based organization"""
+        if self._show_cached_help("location"):
+            return
         help_window = Toplevel(self.root)
+        self._cache_help_window("location", help_window)
         help_window.title("Location Organization Help")
         help_window.geometry("500x400")
         help_window.transient(self.root)
@@ -2808,11 +3973,11 @@ to strip location data from photos before sharing them online.
         text.config(state="disabled")
         
         # Add close button
-        close_button = tk.Button(help_window, text="Close", command=help_window.destroy)
+        close_button = tk.Button(help_window, text="Close", command=help_window.withdraw)
         close_button.pack(pady=10)
 
     def compare_images(self, group, current_index, refresh_callback):
-        if not HAS_PIL:
+        if not self.has_pil():
             messagebox.showinfo("Missing Dependency", "Pillow (PIL) is required for image comparison.")
             return
 
@@ -2830,17 +3995,17 @@ to strip location data from photos before sharing them online.
         def update_display():
             try:
                 # Left image is always the first file (reference)
-                img1 = Image.open(group[0])
-                img1.thumbnail((600, 600), Image.LANCZOS)  # Increased from 550x550 to 600x600
-                photo1 = ImageTk.PhotoImage(img1)
+                with Image.open(group[0]) as img1:
+                    img1.thumbnail((600, 600), Image.LANCZOS)  # Increased from 550x550 to 600x600
+                    photo1 = ImageTk.PhotoImage(img1)
                 left_img_label.config(image=photo1)
                 left_img_label.image = photo1
                 left_header.config(text=os.path.basename(group[0]))
                 left_size.config(text=f"Size: {self.format_size(os.path.getsize(group[0]))}")
                 # Right image is the current comparison file
-                img2 = Image.open(group[current_index])
-                img2.thumbnail((600, 600), Image.LANCZOS)  # Increased from 550x550 to 600x600
-                photo2 = ImageTk.PhotoImage(img2)
+                with Image.open(group[current_index]) as img2:
+                    img2.thumbnail((600, 600), Image.LANCZOS)  # Increased from 550x550 to 600x600
+                    photo2 = ImageTk.PhotoImage(img2)
                 right_img_label.config(image=photo2)
                 right_img_label.image = photo2
                 right_header.config(text=os.path.basename(group[current_index]))
@@ -2889,6 +4054,7 @@ to strip location data from photos before sharing them online.
             try:
                 if messagebox.askyesno("Confirm Deletion",
                                    f"Delete '{os.path.basename(group[current_index])}'?"):
+                    self._invalidate_scan_cache()
                     os.remove(group[current_index])
                     self.log(f"Deleted: {group[current_index]}")
                     group.pop(current_index)
@@ -2938,7 +4104,7 @@ to strip location data from photos before sharing them online.
             return
 
         # Check if PIL is installed as it's required for this feature
-        if not HAS_PIL:
+        if not self.has_pil():
             messagebox.showwarning("Missing Dependency", 
                                   "Pillow (PIL) is required for resolution-based organization.\n\n"
                                   "Please install it with: pip install pillow")
@@ -2962,7 +4128,7 @@ to strip location data from photos before sharing them online.
         try:
             preview = []
             # Count files in each category for logging
-            resolution_counts = {}
+            resolution_counts = defaultdict(int)
             
             # Get all files
             files = self.get_files_with_progress(folder)
@@ -2984,12 +4150,11 @@ to strip location data from photos before sharing them online.
                 if self.cancel_scan:
                     raise InterruptedError("Resolution analysis was cancelled")
                     
-                if os.path.isfile(file_path):
-                    ext = os.path.splitext(file_path)[1].lower()
-                    if ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp']:
-                        image_files.append(file_path)
-                    else:
-                        other_files.append(file_path)
+                # Already regular files - the scan checked their type
+                if _file_extension(os.path.basename(file_path)).lower() in self._RESOLUTION_IMAGE_EXTENSIONS:
+                    image_files.append(file_path)
+                else:
+                    other_files.append(file_path)
             
             # Process image files to analyze resolution
             img_count = len(image_files)
@@ -3007,8 +4172,6 @@ to strip location data from photos before sharing them online.
                     resolution_category = self.get_image_resolution_category(file_path)
                     
                     # Keep track of how many files in each category
-                    if resolution_category not in resolution_counts:
-                        resolution_counts[resolution_category] = 0
                     resolution_counts[resolution_category] += 1
                     
                     # Create destination path
@@ -3029,8 +4192,6 @@ to strip location data from photos before sharing them online.
                 dest_path = os.path.join(resolution_folder, os.path.basename(file_path))
                 preview.append((file_path, dest_path))
                 
-            if "Other Files" not in resolution_counts:
-                resolution_counts["Other Files"] = 0
             resolution_counts["Other Files"] += len(other_files)
             
             # Final progress update
@@ -3049,9 +4210,9 @@ to strip location data from photos before sharing them online.
                 self.log(f"  {category}: {count} files")
             
             # Show preview window on main thread
-            self.root.after(0, lambda p=list(preview): self.show_preview(p))
+            self.root.after(0, self.show_preview, preview)
             message = f"Preview ready: {len(preview)} files to organize by resolution"
-            self.root.after(0, lambda: self.status_label.config(text=message))
+            self.post_status(message)
             self.log(message)
             
             # Close progress dialog
@@ -3063,7 +4224,6 @@ to strip location data from photos before sharing them online.
             
         except Exception as e:
             self.log(f"Error generating preview: {str(e)}")
-            import traceback
             self.log(traceback.format_exc())
             self.close_processing_dialog()
             self.root.after(0, lambda: messagebox.showerror("Error", 
@@ -3102,6 +4262,7 @@ to strip location data from photos before sharing them online.
             return "Unknown Resolution"
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # EXIF worker processes in frozen builds
     root = tk.Tk()
     app = FileOrganizerApp(root)
     root.mainloop()